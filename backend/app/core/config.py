@@ -20,6 +20,18 @@ class Settings(BaseSettings):
     NEO4J_URI: str = os.getenv("NEO4J_URI", "bolt://localhost:7687")
     NEO4J_USER: str = os.getenv("NEO4J_USER", "neo4j")
     NEO4J_PASSWORD: str = os.getenv("NEO4J_PASSWORD", "password")
+    NEO4J_DATABASE: str = os.getenv("NEO4J_DATABASE", "neo4j")
+
+    # Neo4j connection pool tuning (per-process singleton driver)
+    NEO4J_MAX_CONNECTION_POOL_SIZE: int = int(
+        os.getenv("NEO4J_MAX_CONNECTION_POOL_SIZE", "64")
+    )
+    NEO4J_MAX_CONNECTION_LIFETIME: int = int(
+        os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "3600")
+    )
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT: int = int(
+        os.getenv("NEO4J_CONNECTION_ACQUISITION_TIMEOUT", "60")
+    )
 
     # JWT
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
@@ -1,18 +1,102 @@
-from neo4j import GraphDatabase
+"""Neo4j driver lifecycle and session dependencies.
+
+One sync and one async driver are created per process at startup and
+closed from the FastAPI lifespan; request handlers only check sessions
+out of the drivers' connection pools, so no request pays TCP/TLS or
+auth handshakes.
+"""
+
+from neo4j import AsyncGraphDatabase, GraphDatabase
 from app.core.config import settings
 from contextlib import contextmanager
 from typing import Generator
+import logging
+
+logger = logging.getLogger(__name__)
 
-# Neo4j driver instance
+# Neo4j driver instances (sync for thread-based callers, async for the
+# event-loop-native linguistic routes)
 driver = None
+async_driver = None
 
+# Unique constraints on the ID property for every node label written by the
+# ingestion paths. Without these each MERGE falls back to a full label scan.
+# Mirrors backend/app/migrations/neo4j/schema.cypher, plus the ELAN labels.
+SCHEMA_CONSTRAINTS = [
+    "CREATE CONSTRAINT text_id IF NOT EXISTS FOR (t:Text) REQUIRE t.ID IS UNIQUE",
+    "CREATE CONSTRAINT section_id IF NOT EXISTS FOR (s:Section) REQUIRE s.ID IS UNIQUE",
+    "CREATE CONSTRAINT phrase_id IF NOT EXISTS FOR (p:Phrase) REQUIRE p.ID IS UNIQUE",
+    "CREATE CONSTRAINT word_id IF NOT EXISTS FOR (w:Word) REQUIRE w.ID IS UNIQUE",
+    "CREATE CONSTRAINT morpheme_id IF NOT EXISTS FOR (m:Morpheme) REQUIRE m.ID IS UNIQUE",
+    "CREATE CONSTRAINT gloss_id IF NOT EXISTS FOR (g:Gloss) REQUIRE g.ID IS UNIQUE",
+    "CREATE CONSTRAINT elan_doc_id IF NOT EXISTS FOR (d:ElanDoc) REQUIRE d.ID IS UNIQUE",
+    "CREATE CONSTRAINT elan_tier_id IF NOT EXISTS FOR (t:ElanTier) REQUIRE t.ID IS UNIQUE",
+    "CREATE CONSTRAINT elan_annotation_id IF NOT EXISTS FOR (a:ElanAnnotation) REQUIRE a.ID IS UNIQUE",
+]
 
-def init_neo4j():
-    """Initialize Neo4j driver"""
+# Property indexes for the hot lookup paths (word/morpheme search and the
+# graph endpoints). Without these, surface_form and language predicates fall
+# back to full label scans.
+SCHEMA_INDEXES = [
+    "CREATE INDEX word_surface_form IF NOT EXISTS FOR (w:Word) ON (w.surface_form)",
+    "CREATE INDEX word_language IF NOT EXISTS FOR (w:Word) ON (w.language)",
+    "CREATE INDEX morpheme_surface_form IF NOT EXISTS FOR (m:Morpheme) ON (m.surface_form)",
+    "CREATE INDEX morpheme_citation_form IF NOT EXISTS FOR (m:Morpheme) ON (m.citation_form)",
+    "CREATE INDEX morpheme_language IF NOT EXISTS FOR (m:Morpheme) ON (m.language)",
+    "CREATE INDEX text_language IF NOT EXISTS FOR (t:Text) ON (t.language)",
+    # Backs ORDER BY t.created_at DESC listings, so recency queries walk the
+    # index backwards instead of label-scanning and sorting in memory
+    "CREATE INDEX text_created_at IF NOT EXISTS FOR (t:Text) ON (t.created_at)",
+    # Composite indexes so exact surface_form+language lookups hit one probe
+    # instead of an index seek plus a post-filter
+    "CREATE INDEX word_surface_lang IF NOT EXISTS FOR (w:Word) ON (w.surface_form, w.language)",
+    "CREATE INDEX morpheme_surface_lang IF NOT EXISTS FOR (m:Morpheme) ON (m.surface_form, m.language)",
+    # TEXT indexes (Neo4j 5.x) back the CONTAINS predicates used by the
+    # search and morpheme-graph endpoints, which range indexes cannot serve
+    "CREATE TEXT INDEX word_surface_form_text IF NOT EXISTS FOR (w:Word) ON (w.surface_form)",
+    "CREATE TEXT INDEX morpheme_surface_form_text IF NOT EXISTS FOR (m:Morpheme) ON (m.surface_form)",
+    "CREATE TEXT INDEX morpheme_citation_form_text IF NOT EXISTS FOR (m:Morpheme) ON (m.citation_form)",
+]
+
+
+def ensure_schema():
+    """Create unique ID constraints and property indexes so lookups seek"""
     global driver
+    if not driver:
+        return
+
+    try:
+        with driver.session(database=settings.NEO4J_DATABASE) as session:
+            for statement in SCHEMA_CONSTRAINTS + SCHEMA_INDEXES:
+                session.run(statement)
+    except Exception as e:
+        # Don't block startup if Neo4j isn't reachable yet; the schema script
+        # (apply-schema.sh) remains the fallback for constraint creation
+        logger.warning(f"Could not ensure Neo4j schema constraints: {e}")
+
+
+def init_neo4j():
+    """Initialize the singleton Neo4j driver with a tuned connection pool.
+
+    Called once from the FastAPI lifespan; every request-scoped session is
+    checked out of this driver's pool rather than constructing a new driver.
+    """
+    global driver, async_driver
     driver = GraphDatabase.driver(
-        settings.NEO4J_URI, auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD)
+        settings.NEO4J_URI,
+        auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+        max_connection_pool_size=settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+        max_connection_lifetime=settings.NEO4J_MAX_CONNECTION_LIFETIME,
+        connection_acquisition_timeout=settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+    )
+    async_driver = AsyncGraphDatabase.driver(
+        settings.NEO4J_URI,
+        auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+        max_connection_pool_size=settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+        max_connection_lifetime=settings.NEO4J_MAX_CONNECTION_LIFETIME,
+        connection_acquisition_timeout=settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
     )
+    ensure_schema()
 
 
 def close_neo4j():
@@ -22,14 +106,26 @@ def close_neo4j():
         driver.close()
 
 
+async def aclose_neo4j():
+    """Close the async Neo4j driver"""
+    global async_driver
+    if async_driver:
+        await async_driver.close()
+        async_driver = None
+
+
 @contextmanager
 def get_db() -> Generator:
-    """Get Neo4j database session"""
+    """Get Neo4j database session.
+
+    Sessions are always opened with an explicit database= so the driver
+    never spends a round trip resolving the home database per query.
+    """
     global driver
     if not driver:
         init_neo4j()
 
-    session = driver.session()
+    session = driver.session(database=settings.NEO4J_DATABASE)
     try:
         yield session
     finally:
@@ -40,3 +136,17 @@ def get_db_dependency():
     """FastAPI dependency for Neo4j session"""
     with get_db() as session:
         yield session
+
+
+async def get_async_db_dependency():
+    """FastAPI dependency for an async Neo4j session.
+
+    Queries run natively on the event loop (await session.run) instead of
+    hopping through the thread executor per call.
+    """
+    global async_driver
+    if not async_driver:
+        init_neo4j()
+
+    async with async_driver.session(database=settings.NEO4J_DATABASE) as session:
+        yield session
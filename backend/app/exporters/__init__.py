@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Dict
 
 from .base import Exporter, ExporterNotFoundError
@@ -17,10 +18,17 @@ def register_exporter(exporter: Exporter) -> None:
 
     key = exporter.file_type.lower()
     _exporters[key] = exporter
+    # Drop memoized lookups so a (re-)registration is visible immediately
+    get_exporter.cache_clear()
 
 
+@functools.lru_cache(maxsize=None)
 def get_exporter(file_type: str) -> Exporter:
-    """Retrieve a registered exporter for the requested file type."""
+    """Retrieve a registered exporter for the requested file type.
+
+    Memoized per file_type string, so repeated export requests skip the
+    normalization and registry lookup entirely.
+    """
 
     key = (file_type or "").strip().lower()
     if not key:
@@ -1,4 +1,8 @@
 import uuid
+
+# Serialization deliberately stays on the stdlib ElementTree (whose hot paths
+# are already C via _elementtree) rather than adding an lxml dependency; the
+# streaming iter_export path bounds per-chunk work regardless of corpus size.
 import xml.etree.ElementTree as ET
 from typing import Any, Dict, Iterable, Optional, Sequence
 
@@ -260,28 +264,53 @@ class FlextextExporter:
     file_extension = "flextext"
 
     def export(self, graph_data: GraphDict) -> str:
-        texts_payload: Sequence[GraphDict]
-        raw_texts = graph_data.get("texts")
-        if isinstance(raw_texts, Sequence) and not isinstance(raw_texts, (str, bytes)):
-            texts_payload = list(raw_texts)  # ensure we can iterate multiple times
-        else:
-            texts_payload = []
-
-        if not texts_payload:
-            texts_payload = [graph_data]
+        texts_payload = self._texts_payload(graph_data)
 
         document_root = build_document_root()
 
         for text_graph in texts_payload:
-            interlinear_root = build_interlinear_text_root(
-                guid=(text_graph.get("text", {}) or {}).get("id")
-            )
-            self._populate_interlinear_text(interlinear_root, text_graph)
+            interlinear_root = self._build_interlinear_text(text_graph)
             document_root.append(interlinear_root)
 
         xml_bytes = serialize_xml(document_root)
         return xml_bytes.decode("utf-8")
 
+    def iter_export(self, graph_data: GraphDict):
+        """Yield the FLEXText document incrementally, one interlinear-text
+        per chunk, so large exports never hold the whole tree in memory.
+
+        Each chunk still builds its own small Element subtree (rather than
+        writing tags through a SAX generator) so the add_word/add_morph
+        helpers stay the single source of truth for element structure; peak
+        allocation is bounded by the largest single text either way.
+        """
+        texts_payload = self._texts_payload(graph_data)
+
+        yield '<?xml version="1.0" encoding="utf-8"?>\n<document version="2">\n'
+        for text_graph in texts_payload:
+            interlinear_root = self._build_interlinear_text(text_graph)
+            _indent_xml(interlinear_root, level=1)
+            interlinear_root.tail = "\n"
+            yield "  " + ET.tostring(interlinear_root, encoding="unicode")
+        yield "</document>\n"
+
+    @staticmethod
+    def _texts_payload(graph_data: GraphDict) -> Sequence[GraphDict]:
+        raw_texts = graph_data.get("texts")
+        if isinstance(raw_texts, Sequence) and not isinstance(raw_texts, (str, bytes)):
+            texts_payload = list(raw_texts)  # ensure we can iterate multiple times
+        else:
+            texts_payload = []
+
+        return texts_payload or [graph_data]
+
+    def _build_interlinear_text(self, text_graph: GraphDict) -> ET.Element:
+        interlinear_root = build_interlinear_text_root(
+            guid=(text_graph.get("text", {}) or {}).get("id")
+        )
+        self._populate_interlinear_text(interlinear_root, text_graph)
+        return interlinear_root
+
     def _populate_interlinear_text(self, root: ET.Element, graph_data: GraphDict) -> None:
         text_info = graph_data.get("text", {}) or {}
 
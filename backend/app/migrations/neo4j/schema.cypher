@@ -41,18 +41,40 @@ FOR (w:Word) ON (w.surface_form);
 CREATE INDEX word_language IF NOT EXISTS
 FOR (w:Word) ON (w.language);
 
+CREATE INDEX morpheme_surface_form IF NOT EXISTS
+FOR (m:Morpheme) ON (m.surface_form);
+
 CREATE INDEX morpheme_citation_form IF NOT EXISTS
 FOR (m:Morpheme) ON (m.citation_form);
 
+CREATE INDEX morpheme_language IF NOT EXISTS
+FOR (m:Morpheme) ON (m.language);
+
 CREATE INDEX morpheme_gloss IF NOT EXISTS
 FOR (m:Morpheme) ON (m.gloss);
 
 CREATE INDEX text_language IF NOT EXISTS
-FOR (t:Text) ON (t.language_code);
+FOR (t:Text) ON (t.language);
+
+// Recency listings (ORDER BY t.created_at DESC LIMIT n) walk this index
+// backwards instead of label-scanning and sorting in memory
+CREATE INDEX text_created_at IF NOT EXISTS
+FOR (t:Text) ON (t.created_at);
 
 CREATE INDEX gloss_annotation IF NOT EXISTS
 FOR (g:Gloss) ON (g.annotation);
 
+// TEXT indexes for substring (CONTAINS) search paths
+
+CREATE TEXT INDEX word_surface_form_text IF NOT EXISTS
+FOR (w:Word) ON (w.surface_form);
+
+CREATE TEXT INDEX morpheme_surface_form_text IF NOT EXISTS
+FOR (m:Morpheme) ON (m.surface_form);
+
+CREATE TEXT INDEX morpheme_citation_form_text IF NOT EXISTS
+FOR (m:Morpheme) ON (m.citation_form);
+
 
 // ---------------------
 // Relationship Pattern Documentation
@@ -1,5 +1,6 @@
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import List, Optional, Dict, Tuple, Union
 
 from pydantic import BaseModel, Field, ConfigDict, conint, confloat, model_validator
@@ -67,6 +68,28 @@ class MorphemeCreate(IdSchema):
     msa: Union[Dict[str, str], List[str], str] = ""
     language: str
 
+    @cached_property
+    def type_value(self) -> str:
+        """type's enum value, resolved once per morpheme.
+
+        Hot paths (stats aggregation, node writes) read the string form
+        repeatedly; caching skips the Enum descriptor hop on each access.
+        """
+        return self.type.value
+
+    @cached_property
+    def msa_str(self) -> str:
+        """msa flattened to the string form stored on the Morpheme node.
+
+        Computed once per morpheme so ingestion doesn't re-run the
+        isinstance/join dance per write.
+        """
+        if isinstance(self.msa, dict):
+            return ",".join(f"{k}:{v}" for k, v in self.msa.items())
+        if isinstance(self.msa, list):
+            return ",".join(self.msa)
+        return str(self.msa)
+
 
 class WordCreate(IdSchema):
     surface_form: str
@@ -75,6 +98,13 @@ class WordCreate(IdSchema):
     morphemes: List[MorphemeCreate] = Field(default_factory=list)
     language: str
 
+    @cached_property
+    def pos_str(self) -> str:
+        """pos tags joined to the string form stored on the Word node."""
+        if isinstance(self.pos, list):
+            return ",".join(self.pos)
+        return self.pos
+
 
 class PhraseCreate(IdSchema):
     segnum: str = ""
@@ -441,7 +441,7 @@ class ElanParser:
                         total_morphemes += len(word.morphemes)
 
                         for morpheme in word.morphemes:
-                            morph_type = morpheme.type.value
+                            morph_type = morpheme.type_value
                             morpheme_types_dict[morph_type] = (
                                 morpheme_types_dict.get(morph_type, 0) + 1
                             )
@@ -1,6 +1,7 @@
 import xml.etree.ElementTree as ET
 import json
 import uuid
+from collections import Counter
 from typing import List, Dict, Optional, Any
 from app.models.linguistic import (
     InterlinearTextCreate,
@@ -28,20 +29,31 @@ class FlexTextParser:
         self.namespace_map = {}
 
     def parse_file(self, file_path: str) -> List[InterlinearTextCreate]:
-        """Parse a .flextext file and return list of InterlinearText objects"""
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-
-        # Handle namespace if present
-        if root.tag.startswith("{"):
-            namespace = root.tag.split("}")[0] + "}"
-            self.namespace_map = {"": namespace}
+        """Parse a .flextext file and return list of InterlinearText objects
 
+        Streams the document with iterparse instead of building a full DOM:
+        each interlinear-text subtree is parsed as soon as it closes and then
+        cleared, so peak memory is bounded by one text rather than the file.
+        """
         texts = []
-        for interlinear_text in root.findall(".//interlinear-text"):
-            text = self._parse_interlinear_text(interlinear_text)
-            if text:
-                texts.append(text)
+        root = None
+
+        for event, elem in ET.iterparse(file_path, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = elem
+                    # Handle namespace if present
+                    if elem.tag.startswith("{"):
+                        namespace = elem.tag.split("}")[0] + "}"
+                        self.namespace_map = {"": namespace}
+                continue
+
+            if elem.tag.split("}")[-1] == "interlinear-text":
+                text = self._parse_interlinear_text(elem)
+                if text:
+                    texts.append(text)
+                # Release the processed subtree
+                elem.clear()
 
         return texts
 
@@ -307,10 +319,15 @@ class FlexTextParser:
         )
 
     def get_language_stats(self, texts: List[InterlinearTextCreate]) -> Dict[str, Any]:
-        """Generate comprehensive statistics about the parsed texts"""
+        """Generate comprehensive statistics about the parsed texts.
+
+        Everything is tallied in one traversal of the tree; per-statistic
+        re-walks would multiply memory traffic on corpora with millions of
+        morphemes.
+        """
         languages_set: set[str] = set()
         pos_tags_set: set[str] = set()
-        morpheme_types_dict: Dict[str, int] = {}
+        morpheme_types: Counter[str] = Counter()
 
         total_sections = 0
         total_phrases = 0
@@ -338,19 +355,15 @@ class FlexTextParser:
                     total_words += len(phrase.words)
                     
                     # Count words from whitespace in surface_text
+                    # (str.split() with no argument already drops empties)
                     if phrase.surface_text:
-                        # Split by whitespace and filter out empty strings
-                        whitespace_words = [
-                            w for w in phrase.surface_text.split() 
-                            if w.strip()
-                        ]
-                        words_by_whitespace += len(whitespace_words)
+                        words_by_whitespace += len(phrase.surface_text.split())
 
                     for word in phrase.words:
                         if word.pos:
-                            # word.pos is now a list, so add each tag individually
-                            for pos_tag in word.pos:
-                                pos_tags_set.add(pos_tag)
+                            # word.pos is a list; update() adds all tags in
+                            # one C-level call
+                            pos_tags_set.update(word.pos)
                         
                         # Check if word has morphemes
                         if word.morphemes and len(word.morphemes) > 0:
@@ -361,12 +374,7 @@ class FlexTextParser:
                             words_with_only_translation += 1
                         
                         total_morphemes += len(word.morphemes)
-
-                        for morpheme in word.morphemes:
-                            morph_type = morpheme.type.value
-                            morpheme_types_dict[morph_type] = (
-                                morpheme_types_dict.get(morph_type, 0) + 1
-                            )
+                        morpheme_types.update(m.type_value for m in word.morphemes)
             
             if text_has_morphemes:
                 texts_with_morphemes.add(text.id)
@@ -386,7 +394,7 @@ class FlexTextParser:
             "words_with_only_translation": words_with_only_translation,
             "total_morphemes": total_morphemes,
             "languages": list(languages_set),
-            "morpheme_types": morpheme_types_dict,
+            "morpheme_types": dict(morpheme_types),
             "pos_tags": list(pos_tags_set),
         }
 
@@ -404,6 +412,16 @@ def get_file_stats(file_path: str) -> Dict[str, Any]:
     return parser.get_language_stats(texts)
 
 
+def compute_stats_from_parsed(texts: List[InterlinearTextCreate]) -> Dict[str, Any]:
+    """Get statistics for already-parsed texts.
+
+    Same result as :func:`get_file_stats`, but walks the in-memory tree
+    instead of re-parsing the XML, for callers that already hold the output
+    of :func:`parse_flextext_file`.
+    """
+    return FlexTextParser().get_language_stats(texts)
+
+
 # Methods for creating JSON objects from FLEx
 def _morpheme_to_dict(m) -> Dict[str, Any]:
     return {
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
-from app.database import get_db_dependency
+from app.database import get_async_db_dependency
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
@@ -40,17 +40,19 @@ def create_access_token(data: dict):
 
 
 @router.post("/register", response_model=Token)
-async def register(user: UserCreate, db=Depends(get_db_dependency)):
+async def register(user: UserCreate, db=Depends(get_async_db_dependency)):
     """Register a new user"""
     try:
         # Check if user exists
-        result = db.run("MATCH (u:User {email: $email}) RETURN u", email=user.email)
-        if result.single():
+        result = await db.run(
+            "MATCH (u:User {email: $email}) RETURN u", email=user.email
+        )
+        if await result.single():
             raise HTTPException(status_code=400, detail="Email already registered")
 
         # Create user
         hashed_password = pwd_context.hash(user.password)
-        result = db.run(
+        result = await db.run(
             """
             CREATE (u:User {
                 email: $email,
@@ -65,7 +67,7 @@ async def register(user: UserCreate, db=Depends(get_db_dependency)):
             password=hashed_password,
         )
 
-        user_data = result.single()
+        user_data = await result.single()
         access_token = create_access_token(data={"sub": user_data["email"]})
         return {"access_token": access_token, "token_type": "bearer"}
 
@@ -74,15 +76,15 @@ async def register(user: UserCreate, db=Depends(get_db_dependency)):
 
 
 @router.post("/login", response_model=Token)
-async def login(user: UserLogin, db=Depends(get_db_dependency)):
+async def login(user: UserLogin, db=Depends(get_async_db_dependency)):
     """Login user and return access token"""
     try:
         # Get user
-        result = db.run(
+        result = await db.run(
             "MATCH (u:User {email: $email}) RETURN u.email as email, u.password as password, u.name as name",
             email=user.email,
         )
-        user_data = result.single()
+        user_data = await result.single()
 
         if not user_data or not pwd_context.verify(
             user.password, user_data["password"]
@@ -97,11 +99,13 @@ async def login(user: UserLogin, db=Depends(get_db_dependency)):
 
 
 @router.get("/me")
-async def get_current_user(db=Depends(get_db_dependency)):
+async def get_current_user(db=Depends(get_async_db_dependency)):
     """Get current user information (simplified for demo)"""
     # In a real app, you'd decode the JWT token and get the actual user
-    result = db.run("MATCH (u:User) RETURN u.email as email, u.name as name LIMIT 1")
-    user_data = result.single()
+    result = await db.run(
+        "MATCH (u:User) RETURN u.email as email, u.name as name LIMIT 1"
+    )
+    user_data = await result.single()
     if user_data:
         return {"email": user_data["email"], "name": user_data["name"]}
     else:
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from typing import List, Optional
 from pydantic import BaseModel
-from app.database import get_db_dependency
+from app.database import get_async_db_dependency
 import uuid
 
 router = APIRouter()
@@ -25,7 +25,7 @@ class DocumentResponse(BaseModel):
 @router.post("/", response_model=DocumentResponse)
 async def create_document(
     document: DocumentCreate,
-    db=Depends(get_db_dependency),
+    db=Depends(get_async_db_dependency),
 ):
     """Create a new documentation entry"""
     try:
@@ -33,7 +33,7 @@ async def create_document(
 
         # Create document and optionally link to language
         if document.language_id:
-            result = db.run(
+            result = await db.run(
                 """
                 MATCH (l:Language {id: $language_id})
                 CREATE (d:Document {
@@ -52,7 +52,7 @@ async def create_document(
                 language_id=document.language_id,
             )
         else:
-            result = db.run(
+            result = await db.run(
                 """
                 CREATE (d:Document {
                     id: $id,
@@ -68,7 +68,7 @@ async def create_document(
                 content=document.content,
             )
 
-        document_data = result.single()
+        document_data = await result.single()
         return DocumentResponse(**document_data)
 
     except Exception as e:
@@ -79,7 +79,7 @@ async def create_document(
 async def upload_file(
     file: UploadFile = File(...),
     language_id: str = None,
-    db=Depends(get_db_dependency),
+    db=Depends(get_async_db_dependency),
 ):
     """Upload a file for language documentation (simplified)"""
     try:
@@ -89,7 +89,7 @@ async def upload_file(
         document_id = str(uuid.uuid4())
 
         if language_id:
-            result = db.run(
+            result = await db.run(
                 """
                 MATCH (l:Language {id: $language_id})
                 CREATE (d:Document {
@@ -109,7 +109,7 @@ async def upload_file(
                 language_id=language_id,
             )
         else:
-            result = db.run(
+            result = await db.run(
                 """
                 CREATE (d:Document {
                     id: $id,
@@ -126,7 +126,7 @@ async def upload_file(
                 file_name=file.filename,
             )
 
-        document_data = result.single()
+        document_data = await result.single()
         return {
             "message": "File uploaded successfully",
             "document_id": document_data["id"],
@@ -141,12 +141,12 @@ async def get_documents(
     language_id: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
-    db=Depends(get_db_dependency),
+    db=Depends(get_async_db_dependency),
 ):
     """Get list of documents"""
     try:
         if language_id:
-            result = db.run(
+            result = await db.run(
                 """
                 MATCH (d:Document)-[:DOCUMENTS]->(l:Language {id: $language_id})
                 RETURN d.id as id, d.title as title, d.content as content, 
@@ -159,7 +159,7 @@ async def get_documents(
                 limit=limit,
             )
         else:
-            result = db.run(
+            result = await db.run(
                 """
                 MATCH (d:Document)
                 OPTIONAL MATCH (d)-[:DOCUMENTS]->(l:Language)
@@ -172,7 +172,7 @@ async def get_documents(
                 limit=limit,
             )
 
-        documents = [DocumentResponse(**record) for record in result]
+        documents = [DocumentResponse(**record) async for record in result]
         return documents
 
     except Exception as e:
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import inspect
 import logging
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
 from app.database import get_db_dependency
@@ -65,6 +66,26 @@ async def export_dataset(
         logger.warning("Export failed: no texts found", extra={**context, "error": message})
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message)
 
+    filename_base = file_id or "export"
+    filename = f"{filename_base}.{exporter.file_extension}"
+    headers = {
+        "Content-Disposition": f"attachment; filename=\"{filename}\"",
+        "X-Lexiconnect-Export": exporter.file_type,
+    }
+
+    # Exporters that can serialize incrementally are streamed chunk by chunk,
+    # so peak memory stays at one interlinear-text and the first bytes reach
+    # the client before the whole document is built. Exporters without a
+    # generator (including test stubs) keep the buffered path.
+    iter_export = getattr(exporter, "iter_export", None)
+    if inspect.isgeneratorfunction(iter_export):
+        logger.info("Streaming export", extra=context)
+        return StreamingResponse(
+            iter_export({"texts": graph_payloads}),
+            media_type=exporter.media_type,
+            headers=headers,
+        )
+
     try:
         export_payload = exporter.export({"texts": graph_payloads})
     except Exception as exc:  # pragma: no cover - unexpected generation issue
@@ -74,13 +95,6 @@ async def export_dataset(
             detail="Unable to generate export output",
         ) from exc
 
-    filename_base = file_id or "export"
-    filename = f"{filename_base}.{exporter.file_extension}"
-    headers = {
-        "Content-Disposition": f"attachment; filename=\"{filename}\"",
-        "X-Lexiconnect-Export": exporter.file_type,
-    }
-
     logger.info(
         "Completed export",
         extra={**context, "bytes": len(export_payload)},
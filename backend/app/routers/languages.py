@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from typing import List
 from pydantic import BaseModel
-from app.database import get_db_dependency
+from app.database import get_async_db_dependency
 import uuid
 
 router = APIRouter()
@@ -25,12 +25,12 @@ class LanguageResponse(BaseModel):
 @router.post("/", response_model=LanguageResponse)
 async def create_language(
     language: LanguageCreate,
-    db=Depends(get_db_dependency),
+    db=Depends(get_async_db_dependency),
 ):
     """Create a new language entry"""
     try:
         language_id = str(uuid.uuid4())
-        result = db.run(
+        result = await db.run(
             """
             CREATE (l:Language {
                 id: $id,
@@ -48,7 +48,7 @@ async def create_language(
             description=language.description,
         )
 
-        language_data = result.single()
+        language_data = await result.single()
         return LanguageResponse(**language_data)
 
     except Exception as e:
@@ -56,10 +56,10 @@ async def create_language(
 
 
 @router.get("/", response_model=List[LanguageResponse])
-async def get_languages(skip: int = 0, limit: int = 100, db=Depends(get_db_dependency)):
+async def get_languages(skip: int = 0, limit: int = 100, db=Depends(get_async_db_dependency)):
     """Get list of languages"""
     try:
-        result = db.run(
+        result = await db.run(
             """
             MATCH (l:Language)
             RETURN l.id as id, l.name as name, l.iso_code as iso_code, 
@@ -71,7 +71,7 @@ async def get_languages(skip: int = 0, limit: int = 100, db=Depends(get_db_depen
             limit=limit,
         )
 
-        languages = [LanguageResponse(**record) for record in result]
+        languages = [LanguageResponse(**record) async for record in result]
         return languages
 
     except Exception as e:
@@ -79,10 +79,10 @@ async def get_languages(skip: int = 0, limit: int = 100, db=Depends(get_db_depen
 
 
 @router.get("/{language_id}", response_model=LanguageResponse)
-async def get_language(language_id: str, db=Depends(get_db_dependency)):
+async def get_language(language_id: str, db=Depends(get_async_db_dependency)):
     """Get specific language by ID"""
     try:
-        result = db.run(
+        result = await db.run(
             """
             MATCH (l:Language {id: $id})
             RETURN l.id as id, l.name as name, l.iso_code as iso_code, 
@@ -91,7 +91,7 @@ async def get_language(language_id: str, db=Depends(get_db_dependency)):
             id=language_id,
         )
 
-        language_data = result.single()
+        language_data = await result.single()
         if not language_data:
             raise HTTPException(status_code=404, detail="Language not found")
 
@@ -1,59 +1,213 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Response, Query
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Request,
+    UploadFile,
+    File,
+    Response,
+    Query,
+)
+from fastapi.responses import ORJSONResponse
+from bisect import bisect_left
+from collections import Counter
+from types import MappingProxyType
 from typing import List, Optional, Any, Tuple
-from pydantic import ValidationError
-from app.database import get_db_dependency
+from pydantic import TypeAdapter, ValidationError
+from app import database
+from app.core.config import settings
+from app.database import get_async_db_dependency
 from app.models.linguistic import (
     InterlinearTextCreate,
     InterlinearTextResponse,
     WordCreate,
     WordSearchQuery,
     WordResponse,
-    MorphemeCreate,
     MorphemeSearchQuery,
     MorphemeResponse,
-    SectionCreate,
-    PhraseCreate,
     ConcordanceQuery,
     ConcordanceResult,
     GlossTarget,
 )
-from app.parsers.flextext_parser import parse_flextext_file, get_file_stats
+from app.parsers.flextext_parser import parse_flextext_file, compute_stats_from_parsed
 from app.parsers.elan_parser import (
     parse_eaf_file as parse_elan_eaf_file,
     parse_eaf_to_json_string as parse_elan_eaf_to_json_string,
     parse_elan_file,
     get_elan_file_stats,
 )
+import asyncio
+import functools
+import hashlib
+import sys
 import tempfile
+import time
 import os
-import traceback
 import logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Module-level adapters so list validation runs through pydantic-core in one
+# call instead of constructing a model per record in Python
+_WORD_LIST_ADAPTER = TypeAdapter(List[WordResponse])
+_MORPHEME_LIST_ADAPTER = TypeAdapter(List[MorphemeResponse])
+
 GRAPH_DATA_MIN_LIMIT = 10
 GRAPH_DATA_MAX_LIMIT = 1000
 GRAPH_DATA_DEFAULT_LIMIT = 200
+GRAPH_DATA_MAX_EDGES = 5000
+
+
+# Per-label display constants for the graph endpoints, hoisted to shared
+# read-only maps instead of being rebuilt on every request
+NODE_COLORS = MappingProxyType(
+    {
+        "Text": "#f59e0b",  # amber
+        "Section": "#8b5cf6",  # purple
+        "Phrase": "#06b6d4",  # cyan
+        "Word": "#0ea5e9",  # blue
+        "Morpheme": "#10b981",  # green
+        "Gloss": "#ec4899",  # pink
+    }
+)
+
+# Sizes for the sampled overview graph (larger = higher in the hierarchy)
+NODE_SIZES = MappingProxyType(
+    {
+        "Text": 30,
+        "Section": 22,
+        "Phrase": 16,
+        "Word": 8,
+        "Morpheme": 6,
+        "Gloss": 7,
+    }
+)
+
+# The focused word/morpheme views draw the lower levels slightly larger
+FOCUS_NODE_SIZES = MappingProxyType(
+    {
+        "Text": 30,
+        "Section": 22,
+        "Phrase": 16,
+        "Word": 10,
+        "Morpheme": 8,
+        "Gloss": 7,
+    }
+)
+
+# Which projected field supplies each label's display text
+_LABEL_EXTRACTORS = {
+    "Text": lambda p: p.get("title"),
+    "Word": lambda p: p.get("surface_form"),
+    "Morpheme": lambda p: p.get("surface_form") or p.get("citation_form"),
+    "Gloss": lambda p: (p.get("annotation") or "")[:20] or None,
+    "Phrase": lambda p: (p.get("surface_text") or "")[:30] or None,
+}
+
+
+def _label_for(node_type, props) -> str:
+    """Display text for a node: the type-specific field, falling back to ID"""
+    extractor = _LABEL_EXTRACTORS.get(node_type)
+    text = extractor(props) if extractor else None
+    return text or props.get("ID") or ""
+
+
+def _node_projection(var: str) -> str:
+    """Cypher map projection of just the fields the graph views render.
+
+    Returning this instead of whole nodes keeps Bolt payloads to the handful
+    of label/display properties instead of every property on the node.
+    """
+    return (
+        f"{{id: id({var}), label: head(labels({var})), ID: {var}.ID, "
+        f"title: {var}.title, surface_form: {var}.surface_form, "
+        f"citation_form: {var}.citation_form, annotation: {var}.annotation, "
+        f"surface_text: {var}.surface_text, language: {var}.language}}"
+    )
+
+# Chunk size for spooling uploads to disk without buffering the whole file
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# TTL cache for the read-heavy dashboard endpoints (/stats, /graph-filters,
+# /graph-data). Their results only change on ingestion or wipe, so those
+# write paths call _invalidate_read_cache(). A plain dict with monotonic
+# expiry covers the TTLCache need without pulling in cachetools.
+READ_CACHE_TTL_SECONDS = 60
+_read_cache = {}
+_read_cache_lock = asyncio.Lock()
+
+# Monotonic token bumped on every graph write; doubles as the ETag source for
+# conditional GETs on /graph-filters so unchanged clients get a 304 instead
+# of re-downloading the payload
+_graph_version = 0
+
+
+async def _cached_read(key: tuple, loader):
+    """Return the cached value for key, running loader once on a miss.
+
+    The lock serialises concurrent misses for the same key so a burst of
+    dashboard loads doesn't stampede Neo4j with identical scans.
+    """
+    hit = _read_cache.get(key)
+    if hit is not None and hit[0] > time.monotonic():
+        return hit[1]
+
+    async with _read_cache_lock:
+        hit = _read_cache.get(key)
+        if hit is not None and hit[0] > time.monotonic():
+            return hit[1]
+        value = await loader()
+        _read_cache[key] = (time.monotonic() + READ_CACHE_TTL_SECONDS, value)
+        return value
+
+
+def _invalidate_read_cache():
+    """Drop cached dashboard results after a write changes the graph"""
+    global _graph_version
+    _graph_version += 1
+    _read_cache.clear()
+
+
+def _graph_etag() -> str:
+    """ETag for the current graph version (stable until the next write)"""
+    return f'"{hashlib.md5(str(_graph_version).encode()).hexdigest()}"'
+
+
+async def _spool_upload_to_tempfile(file: UploadFile, suffix: str) -> str:
+    """Stream an uploaded file to a named temp file in chunks.
+
+    Avoids `await file.read()` pulling the entire upload into memory at once;
+    large .flextext/.eaf files are copied a chunk at a time instead. The file
+    is opened unbuffered so each chunk goes straight to the OS without an
+    extra userspace copy.
+
+    Returns:
+        Path to the temp file (caller is responsible for unlinking it).
+    """
+    fd, temp_file_path = tempfile.mkstemp(suffix=suffix)
+    with os.fdopen(fd, "wb", buffering=0) as temp_file:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            temp_file.write(chunk)
+    return temp_file_path
 
 
 @router.post("/upload-flextext")
 async def upload_flextext_file(
-    file: UploadFile = File(...), db=Depends(get_db_dependency)
+    file: UploadFile = File(...), db=Depends(get_async_db_dependency)
 ):
     """Upload and parse a FLEx .flextext file and store in Neo4j using DATABASE.md schema"""
     try:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".flextext") as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
+        # Save uploaded file temporarily (streamed, not read into memory)
+        temp_file_path = await _spool_upload_to_tempfile(file, ".flextext")
 
         try:
-            # Parse the file
-            texts = parse_flextext_file(temp_file_path)
-            stats = get_file_stats(temp_file_path)
+            # Parse the file off the event loop so other requests can proceed
+            texts = await asyncio.to_thread(parse_flextext_file, temp_file_path)
+            # Stats come from the parsed tree; re-reading the file here
+            # would parse the same XML a second time
+            stats = compute_stats_from_parsed(texts)
 
             # Store in graph database using correct schema
             processed_texts = []
@@ -66,6 +220,9 @@ async def upload_flextext_file(
                         {"id": text_id, "title": text.title or text_id}
                     )
 
+            if processed_texts:
+                _invalidate_read_cache()
+
             message = f"Successfully uploaded and processed {file.filename}"
             if skipped_texts:
                 skipped_count = len(skipped_texts)
@@ -84,31 +241,29 @@ async def upload_flextext_file(
             os.unlink(temp_file_path)
 
     except ValidationError as e:
-        error_msg = f"Validation error: {e.errors()}"
-        logger.error(error_msg)
-        logger.error(traceback.format_exc())
-        raise HTTPException(status_code=400, detail=error_msg)
+        logger.exception("Validation error processing %s", file.filename)
+        raise HTTPException(
+            status_code=400, detail=f"Validation error: {e.errors()}"
+        )
     except Exception as e:
-        error_msg = f"Error processing file: {str(e)}"
-        logger.error(error_msg)
-        logger.error(traceback.format_exc())
-        raise HTTPException(status_code=400, detail=error_msg)
+        logger.exception("Error processing %s", file.filename)
+        raise HTTPException(
+            status_code=400, detail=f"Error processing file: {str(e)}"
+        )
 
 
 @router.post("/upload-elan")
-async def upload_elan_file(file: UploadFile = File(...), db=Depends(get_db_dependency)):
+async def upload_elan_file(file: UploadFile = File(...), db=Depends(get_async_db_dependency)):
     """Upload and parse an ELAN .eaf file and store in Neo4j using DATABASE.md schema (matching Flex model)"""
     try:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".eaf") as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
+        # Save uploaded file temporarily (streamed, not read into memory)
+        temp_file_path = await _spool_upload_to_tempfile(file, ".eaf")
 
         try:
             # Parse the file using the new ELAN parser (returns InterlinearTextCreate objects)
-            texts = parse_elan_file(temp_file_path)
-            stats = get_elan_file_stats(temp_file_path)
+            # Run off the event loop so other requests can proceed
+            texts = await asyncio.to_thread(parse_elan_file, temp_file_path)
+            stats = await asyncio.to_thread(get_elan_file_stats, temp_file_path)
 
             # Store in graph database using correct schema (same as Flex)
             processed_texts = []
@@ -121,6 +276,9 @@ async def upload_elan_file(file: UploadFile = File(...), db=Depends(get_db_depen
                         {"id": text_id, "title": text.title or text_id}
                     )
 
+            if processed_texts:
+                _invalidate_read_cache()
+
             message = f"Successfully uploaded and processed {file.filename}"
             if skipped_texts:
                 skipped_count = len(skipped_texts)
@@ -139,20 +297,51 @@ async def upload_elan_file(file: UploadFile = File(...), db=Depends(get_db_depen
             os.unlink(temp_file_path)
 
     except ValidationError as e:
-        error_msg = f"Validation error: {e.errors()}"
-        logger.error(error_msg)
-        logger.error(traceback.format_exc())
-        raise HTTPException(status_code=400, detail=error_msg)
+        logger.exception("Validation error processing %s", file.filename)
+        raise HTTPException(
+            status_code=400, detail=f"Validation error: {e.errors()}"
+        )
     except Exception as e:
-        error_msg = f"Error processing ELAN file: {str(e)}"
-        logger.error(error_msg)
-        logger.error(traceback.format_exc())
-        raise HTTPException(status_code=400, detail=error_msg)
+        logger.exception("Error processing ELAN file %s", file.filename)
+        raise HTTPException(
+            status_code=400, detail=f"Error processing ELAN file: {str(e)}"
+        )
+
 
+_ELAN_TIER_BATCH_QUERY = """
+    UNWIND $rows AS r
+    MATCH (d:ElanDoc {ID: r.doc_id})
+    MERGE (t:ElanTier {ID: r.id})
+      ON CREATE SET t.created_at = datetime()
+    SET t.tier_id = r.tier_id,
+        t.participant = r.participant,
+        t.linguistic_type_ref = r.linguistic_type_ref,
+        t.parent_ref = r.parent_ref,
+        t.updated_at = datetime()
+    MERGE (d)-[:HAS_TIER]->(t)
+    """
+
+_ELAN_ANNOTATION_BATCH_QUERY = """
+    UNWIND $rows AS r
+    MATCH (t:ElanTier {ID: r.tier_node_id})
+    MERGE (a:ElanAnnotation {ID: r.id})
+      ON CREATE SET a.created_at = datetime()
+    SET a.value = r.value,
+        a.start_ms = r.start_ms,
+        a.end_ms = r.end_ms,
+        a.ref_id = r.ref_id,
+        a.updated_at = datetime()
+    MERGE (t)-[:HAS_ANNOTATION]->(a)
+    """
 
-def _store_elan_graph(parsed_doc: Any, db) -> dict:
+
+async def _store_elan_graph(parsed_doc: Any, db) -> dict:
     """Persist ELAN JSON into Neo4j as ElanDoc/ElanTier/ElanAnnotation nodes.
 
+    Tiers and annotations are flattened into row lists and written through
+    one parameterized UNWIND query each (chunked to INGEST_BATCH_SIZE rows)
+    rather than one round-trip per node.
+
     Returns counts of created/merged nodes and relationships.
     """
     file_name = parsed_doc.get("file") or ""
@@ -163,7 +352,7 @@ def _store_elan_graph(parsed_doc: Any, db) -> dict:
     doc_id = f"elan:{file_name}"
 
     # Create/merge ElanDoc
-    db.run(
+    doc_result = await db.run(
         """
         MERGE (d:ElanDoc {ID: $ID})
           ON CREATE SET d.created_at = datetime()
@@ -177,379 +366,472 @@ def _store_elan_graph(parsed_doc: Any, db) -> dict:
         author=author,
         date=date,
     )
+    await doc_result.consume()
 
-    tier_count = 0
-    ann_count = 0
+    tier_rows = []
+    ann_rows = []
 
     for tier in parsed_doc.get("tiers", []):
         tier_id = tier.get("tier_id") or ""
         node_id = f"{doc_id}#tier:{tier_id}"
 
-        db.run(
-            """
-            MATCH (d:ElanDoc {ID: $doc_id})
-            MERGE (t:ElanTier {ID: $ID})
-              ON CREATE SET t.created_at = datetime()
-            SET t.tier_id = $tier_id,
-                t.participant = $participant,
-                t.linguistic_type_ref = $linguistic_type_ref,
-                t.parent_ref = $parent_ref,
-                t.updated_at = datetime()
-            MERGE (d)-[:HAS_TIER]->(t)
-            """,
-            doc_id=doc_id,
-            ID=node_id,
-            tier_id=tier_id,
-            participant=tier.get("participant"),
-            linguistic_type_ref=tier.get("linguistic_type_ref"),
-            parent_ref=tier.get("parent_ref"),
+        tier_rows.append(
+            {
+                "id": node_id,
+                "doc_id": doc_id,
+                "tier_id": tier_id,
+                "participant": tier.get("participant"),
+                "linguistic_type_ref": tier.get("linguistic_type_ref"),
+                "parent_ref": tier.get("parent_ref"),
+            }
         )
-        tier_count += 1
 
         for ann in tier.get("annotations", []):
             ann_id = ann.get("id") or ""
-            ann_node_id = f"{node_id}#ann:{ann_id}"
-
-            db.run(
-                """
-                MATCH (t:ElanTier {ID: $tier_node_id})
-                MERGE (a:ElanAnnotation {ID: $ID})
-                  ON CREATE SET a.created_at = datetime()
-                SET a.value = $value,
-                    a.start_ms = $start_ms,
-                    a.end_ms = $end_ms,
-                    a.ref_id = $ref_id,
-                    a.updated_at = datetime()
-                MERGE (t)-[:HAS_ANNOTATION]->(a)
-                """,
-                tier_node_id=node_id,
-                ID=ann_node_id,
-                value=ann.get("value"),
-                start_ms=ann.get("start_ms"),
-                end_ms=ann.get("end_ms"),
-                ref_id=ann.get("ref_id"),
+            ann_rows.append(
+                {
+                    "id": f"{node_id}#ann:{ann_id}",
+                    "tier_node_id": node_id,
+                    "value": ann.get("value"),
+                    "start_ms": ann.get("start_ms"),
+                    "end_ms": ann.get("end_ms"),
+                    "ref_id": ann.get("ref_id"),
+                }
             )
-            ann_count += 1
 
-    return {"tiers": tier_count, "annotations": ann_count}
+    await _run_batched(db, _ELAN_TIER_BATCH_QUERY, tier_rows)
+    await _run_batched(db, _ELAN_ANNOTATION_BATCH_QUERY, ann_rows)
+
+    return {"tiers": len(tier_rows), "annotations": len(ann_rows)}
+
+
+# Rows per UNWIND batch - keeps each write round-trip bounded while amortizing
+# the per-query overhead over thousands of MERGEs
+INGEST_BATCH_SIZE = 1000
+
+# One query per batch of sections writes the whole Section->Phrase->Word
+# subtree (nodes plus ordering edges) via nested FOREACH, so the hierarchy
+# costs a single round-trip per text instead of one per node/edge type.
+# Relies on the unique ID constraints so every inner MERGE is an index seek.
+_TEXT_HIERARCHY_BATCH_QUERY = """
+    UNWIND $rows AS sec
+    MATCH (t:Text {ID: sec.text_id})
+    MERGE (s:Section {ID: sec.id})
+      ON CREATE SET s.created_at = datetime()
+    SET s.order = sec.order,
+        s.updated_at = datetime()
+    MERGE (t)-[:SECTION_PART_OF_TEXT]->(s)
+    FOREACH (ph IN sec.phrases |
+        MERGE (p:Phrase {ID: ph.id})
+          ON CREATE SET p.created_at = datetime()
+        SET p.segnum = ph.segnum,
+            p.surface_text = ph.surface_text,
+            p.language = ph.language,
+            p.updated_at = datetime()
+        MERGE (s)-[:PHRASE_IN_SECTION]->(p)
+        FOREACH (wd IN ph.words |
+            MERGE (w:Word {ID: wd.id})
+              ON CREATE SET w.created_at = datetime()
+            SET w.surface_form = wd.surface_form,
+                w.gloss = wd.gloss,
+                w.pos = wd.pos,
+                w.language = wd.language,
+                w.updated_at = datetime()
+            MERGE (p)-[:PHRASE_COMPOSED_OF {Order: wd.order}]->(w)
+        )
+    )
+    FOREACH (wd IN sec.words |
+        MERGE (w:Word {ID: wd.id})
+        MERGE (s)-[:SECTION_CONTAINS]->(w)
+    )
+    """
 
+_MORPHEME_BATCH_QUERY = """
+    UNWIND $rows AS r
+    MATCH (w:Word {ID: r.word_id})
+    MERGE (m:Morpheme {ID: r.id})
+      ON CREATE SET m.created_at = datetime()
+    SET m.type = r.type,
+        m.surface_form = r.surface_form,
+        m.citation_form = r.citation_form,
+        m.gloss = r.gloss,
+        m.msa = r.msa,
+        m.language = r.language,
+        m.original_guid = r.original_guid,
+        m.updated_at = datetime()
+    MERGE (w)-[:WORD_MADE_OF]->(m)
+    """
 
-async def _store_interlinear_text(text: InterlinearTextCreate, db) -> Tuple[str, bool]:
-    """Store an interlinear text using DATABASE.md schema relationships
+_WORD_GLOSS_BATCH_QUERY = """
+    UNWIND $rows AS r
+    MATCH (w:Word {ID: r.word_id})
+    MERGE (g:Gloss {ID: r.id})
+      ON CREATE SET g.created_at = datetime()
+    SET g.annotation = r.annotation,
+        g.gloss_type = 'word',
+        g.language = 'en',
+        g.updated_at = datetime()
+    MERGE (g)-[:ANALYZES]->(w)
+    """
 
-    Returns:
-        tuple: (text_id, was_created) where was_created is True if the text was newly created,
-               False if it already existed in the database
+_MORPHEME_GLOSS_BATCH_QUERY = """
+    UNWIND $rows AS r
+    MATCH (m:Morpheme {ID: r.morpheme_id})
+    MERGE (g:Gloss {ID: r.id})
+      ON CREATE SET g.created_at = datetime()
+    SET g.annotation = r.annotation,
+        g.gloss_type = 'morpheme',
+        g.language = 'en',
+        g.updated_at = datetime()
+    MERGE (g)-[:ANALYZES]->(m)
     """
-    # Check if text already exists
-    existing_text = db.run(
-        """
-        MATCH (t:Text {ID: $ID})
-        RETURN t.ID as ID, t.title as title
-        """,
-        ID=text.id,
-    ).single()
 
-    was_created = existing_text is None
 
-    # Create the Text node with ID property (matching schema)
-    # Use MERGE directly without MATCH to avoid Cartesian products
-    db.run(
-        """
-        MERGE (t:Text {ID: $ID})
-          ON CREATE SET t.created_at = datetime()
-        SET t.title = $title,
-            t.source = $source,
-            t.comment = $comment,
-            t.language = $language,
-            t.updated_at = datetime()
-        """,
-        ID=text.id,
-        title=text.title,
-        source=text.source,
-        comment=text.comment,
-        language=text.language,
-    )
+async def _run_batched(tx, query: str, rows: List[dict]):
+    """Send rows through an UNWIND query in slices of INGEST_BATCH_SIZE
 
-    # Only store sections if this is a new text (to avoid duplicating sections)
-    if was_created:
-        # Store sections and their components using correct relationships
-        for section in text.sections:
-            await _store_section(section, text.id, db)
+    Results are consumed immediately: these are pure writes, so there are no
+    records to buffer and the driver can reuse the connection right away.
+    """
+    for i in range(0, len(rows), INGEST_BATCH_SIZE):
+        result = await tx.run(query, rows=rows[i : i + INGEST_BATCH_SIZE])
+        await result.consume()
 
-    return (text.id, was_created)
 
+def _word_row(word: WordCreate) -> dict:
+    """Flatten a WordCreate into an UNWIND row (pos list stored as string)"""
+    return {
+        "id": word.id,
+        "surface_form": word.surface_form,
+        "gloss": word.gloss,
+        "pos": word.pos_str,
+        "language": word.language,
+    }
 
-async def _store_section(section: SectionCreate, text_id: str, db):
-    """Store a Section node with SECTION_PART_OF_TEXT relationship"""
 
-    # Create Section node and link to Text in one query to avoid Cartesian products
-    db.run(
-        """
-        MATCH (t:Text {ID: $text_id})
-        MERGE (s:Section {ID: $ID})
-          ON CREATE SET s.created_at = datetime()
-        SET s.order = $order,
-            s.updated_at = datetime()
-        MERGE (t)-[:SECTION_PART_OF_TEXT]->(s)
-        """,
-        text_id=text_id,
-        ID=section.id,
-        order=section.order,
-    )
+def _collect_word_rows(word: WordCreate, words: dict, rows: dict):
+    """Record a word's node, morpheme, and gloss rows, deduplicated by ID.
 
-    # Store phrases with PHRASE_IN_SECTION relationship
-    for phrase in section.phrases:
-        await _store_phrase(phrase, section.id, db)
+    Words reach this twice (once via their phrase, once via section.words) and
+    repeated glosses/morphemes are common in natural-language input, so rows
+    are keyed by node ID: each node is sent to Neo4j exactly once per file.
+    """
+    if word.id in words:
+        return
+    words[word.id] = _word_row(word)
 
-    # Store words with SECTION_CONTAINS relationship
-    for word in section.words:
-        await _store_word_in_section(word, section.id, db)
+    if word.gloss:
+        gloss_id = f"gloss-word-{word.id}"
+        rows["word_glosses"][gloss_id] = {
+            "id": gloss_id,
+            "word_id": word.id,
+            "annotation": word.gloss,
+        }
 
+    for morpheme in word.morphemes:
+        if morpheme.id not in rows["morphemes"]:
+            rows["morphemes"][morpheme.id] = {
+                "id": morpheme.id,
+                "word_id": word.id,
+                "type": morpheme.type_value,
+                "surface_form": morpheme.surface_form,
+                "citation_form": morpheme.citation_form,
+                "gloss": morpheme.gloss,
+                "msa": morpheme.msa_str,
+                "language": morpheme.language,
+                "original_guid": morpheme.original_guid,
+            }
 
-async def _store_phrase(phrase: PhraseCreate, section_id: str, db):
-    """Store a Phrase node with PHRASE_IN_SECTION relationship"""
+        if morpheme.gloss:
+            gloss_id = f"gloss-morph-{morpheme.id}"
+            rows["morpheme_glosses"][gloss_id] = {
+                "id": gloss_id,
+                "morpheme_id": morpheme.id,
+                "annotation": morpheme.gloss,
+            }
 
-    # Create Phrase node and link to Section in one query to avoid Cartesian products
-    db.run(
-        """
-        MATCH (s:Section {ID: $section_id})
-        MERGE (p:Phrase {ID: $ID})
-          ON CREATE SET p.created_at = datetime()
-        SET p.segnum = $segnum,
-            p.surface_text = $surface_text,
-            p.language = $language,
-            p.updated_at = datetime()
-        MERGE (s)-[:PHRASE_IN_SECTION]->(p)
-        """,
-        section_id=section_id,
-        ID=phrase.id,
-        segnum=phrase.segnum,
-        surface_text=phrase.surface_text,
-        language=phrase.language,
-    )
 
-    # Store words in phrase with PHRASE_COMPOSED_OF relationship (includes Order property)
-    for idx, word in enumerate(phrase.words):
-        await _store_word_in_phrase(word, phrase.id, idx, db)
+def _collect_text_rows(text: InterlinearTextCreate) -> dict:
+    """Flatten a text into nested section rows plus flat morpheme/gloss rows
 
+    Section rows carry their phrase and word subtrees so the whole hierarchy
+    is written by the nested-FOREACH query in one pass; morpheme and gloss
+    rows stay flat and deduplicated by ID for their own UNWIND batches.
+    """
+    words: dict = {}
+    rows = {
+        "sections": [],
+        "morphemes": {},
+        "word_glosses": {},
+        "morpheme_glosses": {},
+    }
+
+    for section in text.sections:
+        phrase_rows = []
+        for phrase in section.phrases:
+            word_rows = []
+            for idx, word in enumerate(phrase.words):
+                word_rows.append({**_word_row(word), "order": idx})
+                _collect_word_rows(word, words, rows)
+
+            phrase_rows.append(
+                {
+                    "id": phrase.id,
+                    "segnum": phrase.segnum,
+                    "surface_text": phrase.surface_text,
+                    "language": phrase.language,
+                    "words": word_rows,
+                }
+            )
 
-async def _store_word_in_section(word: WordCreate, section_id: str, db):
-    """Store word with SECTION_CONTAINS relationship"""
+        section_word_ids = []
+        seen_section_words = set()
+        for word in section.words:
+            if word.id not in seen_section_words:
+                seen_section_words.add(word.id)
+                section_word_ids.append({"id": word.id})
+            _collect_word_rows(word, words, rows)
+
+        rows["sections"].append(
+            {
+                "id": section.id,
+                "text_id": text.id,
+                "order": section.order,
+                "phrases": phrase_rows,
+                "words": section_word_ids,
+            }
+        )
 
-    # Create Word node and link to Section - avoid Cartesian products
-    # Convert pos list to string for storage (or handle as list if Neo4j supports it)
-    pos_value = ",".join(word.pos) if isinstance(word.pos, list) else word.pos
+    rows["morphemes"] = list(rows["morphemes"].values())
+    rows["word_glosses"] = list(rows["word_glosses"].values())
+    rows["morpheme_glosses"] = list(rows["morpheme_glosses"].values())
+    return rows
 
-    db.run(
-        """
-        MATCH (s:Section {ID: $section_id})
-        MERGE (w:Word {ID: $ID})
-          ON CREATE SET w.created_at = datetime()
-        SET w.surface_form = $surface_form,
-            w.gloss = $gloss,
-            w.pos = $pos,
-            w.language = $language,
-            w.updated_at = datetime()
-        MERGE (s)-[:SECTION_CONTAINS]->(w)
-        """,
-        section_id=section_id,
-        ID=word.id,
-        surface_form=word.surface_form,
-        gloss=word.gloss,
-        pos=pos_value,
-        language=word.language,
-    )
 
-    # Store morphemes
-    for morpheme in word.morphemes:
-        await _store_morpheme(morpheme, word.id, db)
+async def _store_interlinear_text(
+    text: InterlinearTextCreate, db
+) -> Tuple[str, bool]:
+    """Store an interlinear text using DATABASE.md schema relationships
 
-    # Create Gloss node if word has gloss annotation
-    if word.gloss:
-        await _store_gloss_for_word(word.id, word.gloss, db)
+    Runs on the async driver, so queries issue natively on the event loop
+    without a thread-executor hop per call.
 
+    Writes are batched: the section/phrase/word/morpheme/gloss hierarchy is
+    flattened into row lists, then each node/edge type goes through a single
+    parameterized UNWIND query (chunked to INGEST_BATCH_SIZE rows) instead of
+    one round-trip per record.
 
-async def _store_word_in_phrase(word: WordCreate, phrase_id: str, order: int, db):
-    """Store word with PHRASE_COMPOSED_OF relationship (with Order property)"""
+    All writes for the text run in one explicit transaction, so commit/log
+    flush cost is paid once per file instead of once per auto-committed query.
 
-    # Create Word node and link to Phrase - avoid Cartesian products
-    # Convert pos list to string for storage
-    pos_value = ",".join(word.pos) if isinstance(word.pos, list) else word.pos
+    Returns:
+        tuple: (text_id, was_created) where was_created is True if the text was newly created,
+               False if it already existed in the database
+    """
+    async with await db.begin_transaction() as tx:
+        # Create the Text node with ID property (matching schema). A sentinel
+        # set in ON CREATE/ON MATCH tells us in the same round-trip whether
+        # the node is new, replacing the separate pre-existence MATCH.
+        text_result = await tx.run(
+            """
+            MERGE (t:Text {ID: $ID})
+              ON CREATE SET t.created_at = datetime(), t._new = true
+              ON MATCH SET t._new = false
+            SET t.title = $title,
+                t.source = $source,
+                t.comment = $comment,
+                t.language = $language,
+                t.updated_at = datetime()
+            WITH t, t._new AS was_created
+            REMOVE t._new
+            RETURN was_created
+            """,
+            ID=text.id,
+            title=text.title,
+            source=text.source,
+            comment=text.comment,
+            language=text.language,
+        )
+        text_record = await text_result.single()
+        was_created = bool(text_record and text_record["was_created"])
+
+        # Only store sections if this is a new text (to avoid duplicating sections)
+        if was_created:
+            rows = _collect_text_rows(text)
+
+            # The hierarchy query must land before morphemes/glosses MATCH
+            # the words it creates
+            await _run_batched(tx, _TEXT_HIERARCHY_BATCH_QUERY, rows["sections"])
+            await _run_batched(tx, _MORPHEME_BATCH_QUERY, rows["morphemes"])
+            await _run_batched(tx, _WORD_GLOSS_BATCH_QUERY, rows["word_glosses"])
+            await _run_batched(
+                tx, _MORPHEME_GLOSS_BATCH_QUERY, rows["morpheme_glosses"]
+            )
 
-    db.run(
-        """
-        MATCH (p:Phrase {ID: $phrase_id})
-        MERGE (w:Word {ID: $ID})
-          ON CREATE SET w.created_at = datetime()
-        SET w.surface_form = $surface_form,
-            w.gloss = $gloss,
-            w.pos = $pos,
-            w.language = $language,
-            w.updated_at = datetime()
-        MERGE (p)-[:PHRASE_COMPOSED_OF {Order: $order}]->(w)
-        """,
-        phrase_id=phrase_id,
-        ID=word.id,
-        order=order,
-        surface_form=word.surface_form,
-        gloss=word.gloss,
-        pos=pos_value,
-        language=word.language,
-    )
+        await tx.commit()
 
-    # Store morphemes
-    for morpheme in word.morphemes:
-        await _store_morpheme(morpheme, word.id, db)
+    return (text.id, was_created)
 
-    # Create Gloss node if word has gloss annotation
-    if word.gloss:
-        await _store_gloss_for_word(word.id, word.gloss, db)
 
+# The search Cypher depends only on which filters are set, not their values,
+# so the query text for each filter combination is built once and cached.
+# Neo4j's plan cache is keyed by exact query text, so repeated searches with
+# the same filter shape reuse the compiled plan.
+@functools.lru_cache(maxsize=None)
+def _word_search_cypher(filters: Tuple[str, ...]) -> str:
+    base = ["MATCH (w:Word)"]
+    conditions = []
+
+    if "surface_form" in filters:
+        conditions.append("w.surface_form CONTAINS $surface_form")
+    if "gloss" in filters:
+        conditions.append("w.gloss CONTAINS $gloss")
+    if "pos" in filters:
+        conditions.append("w.pos = $pos")
+    if "language" in filters:
+        conditions.append("w.language = $language")
+    if "morpheme" in filters:
+        base.append("MATCH (w)-[:WORD_MADE_OF]->(m:Morpheme)")
+        conditions.append(
+            "(m.surface_form CONTAINS $morpheme OR m.citation_form CONTAINS $morpheme)"
+        )
 
-async def _store_morpheme(morpheme: MorphemeCreate, word_id: str, db):
-    """Store a Morpheme node with WORD_MADE_OF relationship"""
+    where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
+
+    # Single round-trip: collect the whole filtered set once, return its
+    # size as the total and slice the requested page out of it
+    return (
+        "".join(base)
+        + where_clause
+        + """
+        WITH DISTINCT w
+        OPTIONAL MATCH (w)-[:WORD_MADE_OF]->(m2:Morpheme)
+        WITH w, COUNT(m2) AS morpheme_count
+        ORDER BY w.surface_form
+        WITH collect({
+            ID: w.ID, surface_form: w.surface_form,
+            gloss: w.gloss, pos: w.pos, language: w.language,
+            morpheme_count: morpheme_count,
+            created_at: toString(w.created_at)
+        }) AS rows
+        RETURN size(rows) AS total, rows[$offset..$offset+$limit] AS page
+    """
+    )
 
-    # Convert msa to string if it's a dict or list
-    msa_value = morpheme.msa
-    if isinstance(morpheme.msa, dict):
-        msa_value = ",".join(f"{k}:{v}" for k, v in morpheme.msa.items())
-    elif isinstance(morpheme.msa, list):
-        msa_value = ",".join(morpheme.msa)
 
-    db.run(
-        """
-        MATCH (w:Word {ID: $word_id})
-        MERGE (m:Morpheme {ID: $ID})
-          ON CREATE SET m.created_at = datetime()
-        SET m.type = $type,
-            m.surface_form = $surface_form,
-            m.citation_form = $citation_form,
-            m.gloss = $gloss,
-            m.msa = $msa,
-            m.language = $language,
-            m.original_guid = $original_guid,
-            m.updated_at = datetime()
-        MERGE (w)-[:WORD_MADE_OF]->(m)
-        """,
-        word_id=word_id,
-        ID=morpheme.id,
-        type=morpheme.type.value,
-        surface_form=morpheme.surface_form,
-        citation_form=morpheme.citation_form,
-        gloss=morpheme.gloss,
-        msa=str(msa_value),
-        language=morpheme.language,
-        original_guid=morpheme.original_guid,
+@functools.lru_cache(maxsize=None)
+def _morpheme_search_cypher(filters: Tuple[str, ...]) -> str:
+    conditions = []
+
+    if "surface_form" in filters:
+        conditions.append("m.surface_form CONTAINS $surface_form")
+    if "citation_form" in filters:
+        conditions.append("m.citation_form CONTAINS $citation_form")
+    if "gloss" in filters:
+        conditions.append("m.gloss CONTAINS $gloss")
+    if "type" in filters:
+        conditions.append("m.type = $type")
+    if "language" in filters:
+        conditions.append("m.language = $language")
+
+    where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
+
+    return (
+        "MATCH (m:Morpheme)"
+        + where_clause
+        + """
+        WITH DISTINCT m
+        ORDER BY m.citation_form
+        WITH collect({
+            ID: m.ID, type: m.type,
+            surface_form: m.surface_form, citation_form: m.citation_form,
+            gloss: m.gloss, msa: m.msa, language: m.language,
+            created_at: toString(m.created_at)
+        }) AS rows
+        RETURN size(rows) AS total, rows[$offset..$offset+$limit] AS page
+    """
     )
 
-    # Create Gloss node if morpheme has gloss
-    if morpheme.gloss:
-        await _store_gloss_for_morpheme(morpheme.id, morpheme.gloss, db)
 
+@functools.lru_cache(maxsize=None)
+def _word_graph_cypher(with_language: bool) -> str:
+    """Word-graph query, compiled once per language-filter variant.
 
-async def _store_gloss_for_word(word_id: str, annotation: str, db):
-    """Create a Gloss node linked to a Word with ANALYZES relationship"""
+    The map-syntax MATCH in the language variant lets the planner answer the
+    lookup from the (surface_form, language) composite index in one probe.
+    """
+    match = (
+        "MATCH (w:Word {surface_form: $word, language: $language})"
+        if with_language
+        else "MATCH (w:Word {surface_form: $word})"
+    )
+    return f"""
+        {match}
 
-    gloss_id = f"gloss-word-{word_id}"
+        // Get context
+        OPTIONAL MATCH (t:Text)-[:SECTION_PART_OF_TEXT]->(s:Section)-[:PHRASE_IN_SECTION]->(ph:Phrase)-[:PHRASE_COMPOSED_OF]->(w)
 
-    db.run(
-        """
-        MATCH (w:Word {ID: $word_id})
-        MERGE (g:Gloss {ID: $gloss_id})
-          ON CREATE SET g.created_at = datetime()
-        SET g.annotation = $annotation,
-            g.gloss_type = 'word',
-            g.language = 'en',
-            g.updated_at = datetime()
-        MERGE (g)-[:ANALYZES]->(w)
-        """,
-        word_id=word_id,
-        gloss_id=gloss_id,
-        annotation=annotation,
-    )
+        // Get target word morphemes
+        OPTIONAL MATCH (w)-[:WORD_MADE_OF]->(m:Morpheme)
 
+        // Get target word glosses
+        OPTIONAL MATCH (w)-[:WORD_MADE_OF]->(m2:Morpheme)<-[:ANALYZES]-(g:Gloss)
 
-async def _store_gloss_for_morpheme(morpheme_id: str, annotation: str, db):
-    """Create a Gloss node linked to a Morpheme with ANALYZES relationship"""
+        WITH w, t, s, ph, collect(DISTINCT m) as target_morphemes, collect(DISTINCT g) as target_glosses
 
-    gloss_id = f"gloss-morph-{morpheme_id}"
+        // Find related words - any word that shares at least one morpheme
+        OPTIONAL MATCH (w)-[:WORD_MADE_OF]->(shared:Morpheme)<-[:WORD_MADE_OF]-(related:Word)
+        WHERE related.ID <> w.ID
 
-    db.run(
-        """
-        MATCH (m:Morpheme {ID: $morpheme_id})
-        MERGE (g:Gloss {ID: $gloss_id})
-          ON CREATE SET g.created_at = datetime()
-        SET g.annotation = $annotation,
-            g.gloss_type = 'morpheme',
-            g.language = 'en',
-            g.updated_at = datetime()
-        MERGE (g)-[:ANALYZES]->(m)
-        """,
-        morpheme_id=morpheme_id,
-        gloss_id=gloss_id,
-        annotation=annotation,
-    )
+        WITH w, t, s, ph, target_morphemes, target_glosses, collect(DISTINCT related)[0..10] as related_words
+
+        // Pattern comprehensions expand each related word's morphemes and
+        // glosses (and each gloss's analyzed morpheme ids) inline, so the
+        // whole neighbourhood arrives in this one round trip
+        RETURN {_node_projection("w")} as target_word,
+               {_node_projection("t")} as text,
+               {_node_projection("s")} as section,
+               {_node_projection("ph")} as phrase,
+               [x IN target_morphemes | {_node_projection("x")}] as target_morphemes,
+               [x IN target_glosses | {{node: {_node_projection("x")},
+                   morph_ids: [(x)-[:ANALYZES]->(am:Morpheme) | id(am)]}}] as target_glosses,
+               [rw IN related_words | {{node: {_node_projection("rw")},
+                   morphemes: [(rw)-[:WORD_MADE_OF]->(rm:Morpheme) | {_node_projection("rm")}],
+                   glosses: [(rw)-[:WORD_MADE_OF]->(:Morpheme)<-[:ANALYZES]-(rg:Gloss) |
+                       {{node: {_node_projection("rg")},
+                         morph_ids: [(rg)-[:ANALYZES]->(am2:Morpheme) | id(am2)]}}]
+               }}] as related_words
+    """
 
 
 @router.post("/search/words", response_model=List[WordResponse])
 async def search_words(
-    query: WordSearchQuery, response: Response, db=Depends(get_db_dependency)
+    query: WordSearchQuery, response: Response, db=Depends(get_async_db_dependency)
 ):
     """Search for words based on various criteria"""
     try:
-        base = ["MATCH (w:Word)"]
         params = {}
-        conditions = []
 
         if query.surface_form:
-            conditions.append("w.surface_form CONTAINS $surface_form")
             params["surface_form"] = query.surface_form
-
         if query.gloss:
-            conditions.append("w.gloss CONTAINS $gloss")
             params["gloss"] = query.gloss
-
         if query.pos:
-            conditions.append("w.pos = $pos")
             params["pos"] = query.pos
-
         if query.language:
-            conditions.append("w.language = $language")
             params["language"] = query.language
-
         if query.contains_morpheme:
-            base.append("MATCH (w)-[:WORD_MADE_OF]->(m:Morpheme)")
-            conditions.append(
-                "(m.surface_form CONTAINS $morpheme OR m.citation_form CONTAINS $morpheme)"
-            )
             params["morpheme"] = query.contains_morpheme
 
-        where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
-
-        count_cypher = (
-            "".join(base) + where_clause + " RETURN count(DISTINCT w) AS total"
-        )
-        total = db.run(count_cypher, **params).single()["total"]
-
-        cypher_query = (
-            "".join(base)
-            + where_clause
-            + """
-            OPTIONAL MATCH (w)-[:WORD_MADE_OF]->(m2:Morpheme)
-            WITH w, COUNT(m2) AS morpheme_count
-            RETURN w.ID as ID, w.surface_form as surface_form,
-                   w.gloss as gloss, w.pos as pos, w.language as language,
-                   morpheme_count, toString(w.created_at) as created_at
-            ORDER BY w.surface_form
-            SKIP $offset
-            LIMIT $limit
-        """
-        )
+        # Compiled (and cached) per filter combination, so Neo4j's plan cache
+        # sees a stable query text for each variant
+        cypher_query = _word_search_cypher(tuple(sorted(params)))
         params.update({"limit": query.limit, "offset": query.offset})
 
-        result = db.run(cypher_query, **params)
-        words = [WordResponse(**dict(record)) for record in result]
+        result = await db.run(cypher_query, **params)
+        record = await result.single()
+        total = record["total"] if record else 0
+        words = _WORD_LIST_ADAPTER.validate_python(record["page"] if record else [])
 
         response.headers["X-Total-Count"] = str(total)
         response.headers["X-Limit"] = str(query.limit)
@@ -563,58 +845,32 @@ async def search_words(
 
 @router.post("/search/morphemes", response_model=List[MorphemeResponse])
 async def search_morphemes(
-    query: MorphemeSearchQuery, response: Response, db=Depends(get_db_dependency)
+    query: MorphemeSearchQuery, response: Response, db=Depends(get_async_db_dependency)
 ):
     """Search for morphemes based on various criteria"""
     try:
-        base = ["MATCH (m:Morpheme)"]
         params = {}
-        conditions = []
 
         if query.surface_form:
-            conditions.append("m.surface_form CONTAINS $surface_form")
             params["surface_form"] = query.surface_form
-
         if query.citation_form:
-            conditions.append("m.citation_form CONTAINS $citation_form")
             params["citation_form"] = query.citation_form
-
         if query.gloss:
-            conditions.append("m.gloss CONTAINS $gloss")
             params["gloss"] = query.gloss
-
         if query.type:
-            conditions.append("m.type = $type")
             params["type"] = query.type.value
-
         if query.language:
-            conditions.append("m.language = $language")
             params["language"] = query.language
 
-        where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
-
-        count_cypher = (
-            "".join(base) + where_clause + " RETURN count(DISTINCT m) AS total"
-        )
-        total = db.run(count_cypher, **params).single()["total"]
-
-        cypher_query = (
-            "".join(base)
-            + where_clause
-            + """
-            RETURN m.ID as ID, m.type as type,
-                   m.surface_form as surface_form, m.citation_form as citation_form,
-                   m.gloss as gloss, m.msa as msa, m.language as language,
-                   toString(m.created_at) as created_at
-            ORDER BY m.citation_form
-            SKIP $offset
-            LIMIT $limit
-        """
-        )
+        cypher_query = _morpheme_search_cypher(tuple(sorted(params)))
         params.update({"limit": query.limit, "offset": query.offset})
 
-        result = db.run(cypher_query, **params)
-        morphemes = [MorphemeResponse(**dict(record)) for record in result]
+        result = await db.run(cypher_query, **params)
+        record = await result.single()
+        total = record["total"] if record else 0
+        morphemes = _MORPHEME_LIST_ADAPTER.validate_python(
+            record["page"] if record else []
+        )
 
         response.headers["X-Total-Count"] = str(total)
         response.headers["X-Limit"] = str(query.limit)
@@ -626,169 +882,129 @@ async def search_morphemes(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+# Concordance Cypher is hoisted to module level so Neo4j's plan cache (keyed
+# by exact query text) sees one stable string per target type
+_CONCORDANCE_MORPHEME_CYPHER = """
+    MATCH (m:Morpheme)
+    WHERE (m.surface_form CONTAINS $target OR m.citation_form CONTAINS $target OR m.gloss CONTAINS $target)
+    AND ($language IS NULL OR m.language = $language)
+    MATCH (w:Word)-[:WORD_MADE_OF]->(m)
+    MATCH (ph:Phrase)-[r:PHRASE_COMPOSED_OF]->(w)
+    MATCH (t:Text)-[:SECTION_PART_OF_TEXT]->(s:Section)-[:PHRASE_IN_SECTION]->(ph)
+    WITH ph, w, m, r.Order as word_order, t, s
+    ORDER BY word_order
+    OPTIONAL MATCH (g:Gloss)-[:ANALYZES]->(m)
+    WITH ph, w, m, word_order, t, s, collect(DISTINCT g.annotation) as glosses
+    OPTIONAL MATCH (ph)-[r2:PHRASE_COMPOSED_OF]->(cw:Word)
+    WITH ph, w, m, word_order, t, s, glosses,
+         collect({order: r2.Order, form: cw.surface_form}) as phrase_words
+    RETURN
+        ph.ID as phrase_id,
+        COALESCE(t.title, '') as text_title,
+        COALESCE(s.ID, '') as segnum,
+        m.surface_form as target,
+        word_order as word_index,
+        [g IN glosses WHERE g IS NOT NULL] as glosses,
+        phrase_words
+    ORDER BY t.title, segnum, word_order
+    LIMIT $limit
+    """
+
+_CONCORDANCE_WORD_CYPHER = """
+    MATCH (w:Word)
+    WHERE (w.surface_form CONTAINS $target OR w.gloss CONTAINS $target)
+    AND ($language IS NULL OR w.language = $language)
+    MATCH (ph:Phrase)-[r:PHRASE_COMPOSED_OF]->(w)
+    MATCH (t:Text)-[:SECTION_PART_OF_TEXT]->(s:Section)-[:PHRASE_IN_SECTION]->(ph)
+    WITH ph, w, r.Order as word_order, t, s
+    ORDER BY word_order
+    OPTIONAL MATCH (g:Gloss)-[:ANALYZES]->(w)
+    WITH ph, w, word_order, t, s, collect(DISTINCT g.annotation) as glosses
+    OPTIONAL MATCH (ph)-[r2:PHRASE_COMPOSED_OF]->(cw:Word)
+    WITH ph, w, word_order, t, s, glosses,
+         collect({order: r2.Order, form: cw.surface_form}) as phrase_words
+    RETURN
+        ph.ID as phrase_id,
+        COALESCE(t.title, '') as text_title,
+        COALESCE(s.ID, '') as segnum,
+        w.surface_form as target,
+        word_order as word_index,
+        [g IN glosses WHERE g IS NOT NULL] as glosses,
+        phrase_words
+    ORDER BY t.title, segnum, word_order
+    LIMIT $limit
+    """
+
+_CONCORDANCE_CYPHER_BY_TARGET = {
+    GlossTarget.MORPHEME: _CONCORDANCE_MORPHEME_CYPHER,
+    GlossTarget.WORD: _CONCORDANCE_WORD_CYPHER,
+}
+
+
+def _compute_kwic(
+    phrase_words: List[dict], word_order: Any, context_size: int
+) -> Tuple[List[str], List[str]]:
+    """Slice left/right context out of a phrase's collected word rows.
+
+    Args:
+        phrase_words: List of {order, form} dicts collected by the concordance
+            query (unsorted, may contain null entries from OPTIONAL MATCH).
+        word_order: Order value of the target word within the phrase.
+        context_size: Number of words to keep on each side.
+
+    Returns:
+        (left_context, right_context) surface-form lists.
+    """
+    entries = sorted(
+        (pw for pw in phrase_words if pw.get("order") is not None),
+        key=lambda pw: pw["order"],
+    )
+    words = [pw["form"] for pw in entries]
+    orders = [pw["order"] for pw in entries]
+
+    # orders is sorted, so binary-search for the target instead of a linear
+    # .index() scan; matters when phrases are long and limits are large
+    target_idx = bisect_left(orders, word_order)
+    if target_idx == len(orders) or orders[target_idx] != word_order:
+        return [], []
+
+    left_context = words[max(0, target_idx - context_size) : target_idx]
+    right_context = words[target_idx + 1 : target_idx + 1 + context_size]
+    return left_context, right_context
+
+
 @router.post("/concordance", response_model=List[ConcordanceResult])
 async def concordance_search(
-    query: ConcordanceQuery, response: Response, db=Depends(get_db_dependency)
+    query: ConcordanceQuery, response: Response, db=Depends(get_async_db_dependency)
 ):
     """Concordance search: find patterns across texts with context window (KWIC format)"""
     try:
         results = []
 
-        if query.target_type == GlossTarget.MORPHEME:
-            # Search for morphemes matching the pattern
-            # First, find all matching morphemes and their words
-            cypher_query = """
-            MATCH (m:Morpheme)
-            WHERE (m.surface_form CONTAINS $target OR m.citation_form CONTAINS $target OR m.gloss CONTAINS $target)
-            AND ($language IS NULL OR m.language = $language)
-            MATCH (w:Word)-[:WORD_MADE_OF]->(m)
-            MATCH (ph:Phrase)-[r:PHRASE_COMPOSED_OF]->(w)
-            MATCH (t:Text)-[:SECTION_PART_OF_TEXT]->(s:Section)-[:PHRASE_IN_SECTION]->(ph)
-            WITH ph, w, m, r.Order as word_order, t, s
-            ORDER BY word_order
-            OPTIONAL MATCH (g:Gloss)-[:ANALYZES]->(m)
-            WITH ph, w, m, word_order, t, s, collect(DISTINCT g.annotation) as glosses
-            RETURN 
-                ph.ID as phrase_id,
-                COALESCE(t.title, '') as text_title,
-                COALESCE(s.ID, '') as segnum,
-                m.surface_form as target,
-                word_order as word_index,
-                [g IN glosses WHERE g IS NOT NULL] as glosses
-            ORDER BY t.title, segnum, word_order
-            LIMIT $limit
-            """
+        # The morpheme/word variants share everything but the match pattern;
+        # both precompiled queries take identical parameters
+        cypher_query = _CONCORDANCE_CYPHER_BY_TARGET.get(query.target_type)
 
-            params = {
-                "target": query.target,
-                "language": query.language,
-                "limit": query.limit,
-            }
-
-            result = db.run(cypher_query, **params)
-            for record in result:
-                # Get context words for this phrase
-                phrase_id = record["phrase_id"]
+        if cypher_query:
+            result = await db.run(
+                cypher_query,
+                target=query.target,
+                language=query.language,
+                limit=query.limit,
+            )
+            async for record in result:
                 word_order = record["word_index"]
-
-                # Get all words in the phrase for context
-                context_query = """
-                MATCH (ph:Phrase {ID: $phrase_id})-[r:PHRASE_COMPOSED_OF]->(w:Word)
-                WITH w, r.Order as order
-                ORDER BY order
-                RETURN collect(w.surface_form) as words, collect(order) as orders
-                """
-                context_result = db.run(context_query, phrase_id=phrase_id).single()
-
-                if context_result:
-                    words = context_result["words"] or []
-                    orders = context_result["orders"] or []
-                    try:
-                        target_idx = orders.index(word_order)
-                        left_context = (
-                            words[max(0, target_idx - query.context_size) : target_idx]
-                            if target_idx > 0
-                            else []
-                        )
-                        right_context = (
-                            words[target_idx + 1 : target_idx + 1 + query.context_size]
-                            if target_idx < len(words) - 1
-                            else []
-                        )
-                    except ValueError:
-                        left_context = []
-                        right_context = []
-                else:
-                    left_context = []
-                    right_context = []
-
-                glosses = record.get("glosses") or []
-                results.append(
-                    ConcordanceResult(
-                        target=record["target"],
-                        left_context=left_context,
-                        right_context=right_context,
-                        phrase_id=phrase_id,
-                        text_title=record["text_title"],
-                        segnum=record["segnum"],
-                        word_index=word_order,
-                        glosses=glosses if glosses else None,
-                    )
+                left_context, right_context = _compute_kwic(
+                    record.get("phrase_words") or [], word_order, query.context_size
                 )
 
-        elif query.target_type == GlossTarget.WORD:
-            # Search for words matching the pattern
-            cypher_query = """
-            MATCH (w:Word)
-            WHERE (w.surface_form CONTAINS $target OR w.gloss CONTAINS $target)
-            AND ($language IS NULL OR w.language = $language)
-            MATCH (ph:Phrase)-[r:PHRASE_COMPOSED_OF]->(w)
-            MATCH (t:Text)-[:SECTION_PART_OF_TEXT]->(s:Section)-[:PHRASE_IN_SECTION]->(ph)
-            WITH ph, w, r.Order as word_order, t, s
-            ORDER BY word_order
-            OPTIONAL MATCH (g:Gloss)-[:ANALYZES]->(w)
-            WITH ph, w, word_order, t, s, collect(DISTINCT g.annotation) as glosses
-            RETURN 
-                ph.ID as phrase_id,
-                COALESCE(t.title, '') as text_title,
-                COALESCE(s.ID, '') as segnum,
-                w.surface_form as target,
-                word_order as word_index,
-                [g IN glosses WHERE g IS NOT NULL] as glosses
-            ORDER BY t.title, segnum, word_order
-            LIMIT $limit
-            """
-
-            params = {
-                "target": query.target,
-                "language": query.language,
-                "limit": query.limit,
-            }
-
-            result = db.run(cypher_query, **params)
-            for record in result:
-                # Get context words for this phrase
-                phrase_id = record["phrase_id"]
-                word_order = record["word_index"]
-
-                # Get all words in the phrase for context
-                context_query = """
-                MATCH (ph:Phrase {ID: $phrase_id})-[r:PHRASE_COMPOSED_OF]->(w:Word)
-                WITH w, r.Order as order
-                ORDER BY order
-                RETURN collect(w.surface_form) as words, collect(order) as orders
-                """
-                context_result = db.run(context_query, phrase_id=phrase_id).single()
-
-                if context_result:
-                    words = context_result["words"] or []
-                    orders = context_result["orders"] or []
-                    try:
-                        target_idx = orders.index(word_order)
-                        left_context = (
-                            words[max(0, target_idx - query.context_size) : target_idx]
-                            if target_idx > 0
-                            else []
-                        )
-                        right_context = (
-                            words[target_idx + 1 : target_idx + 1 + query.context_size]
-                            if target_idx < len(words) - 1
-                            else []
-                        )
-                    except ValueError:
-                        left_context = []
-                        right_context = []
-                else:
-                    left_context = []
-                    right_context = []
-
                 glosses = record.get("glosses") or []
                 results.append(
                     ConcordanceResult(
                         target=record["target"],
                         left_context=left_context,
                         right_context=right_context,
-                        phrase_id=phrase_id,
+                        phrase_id=record["phrase_id"],
                         text_title=record["text_title"],
                         segnum=record["segnum"],
                         word_index=word_order,
@@ -803,29 +1019,32 @@ async def concordance_search(
         return results
 
     except Exception as e:
-        logger.error(f"Error in concordance search: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error in concordance search for %s", query.target)
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/texts", response_model=List[InterlinearTextResponse])
+# response_model=None: the Cypher projection already emits the response
+# shape (ID/title/counts/created_at), so re-validating every row through
+# pydantic on the way out would be pure duplicated CPU on large pages
+@router.get("/texts", response_model=None)
 async def get_texts(
     language: Optional[str] = None,
     skip: int = 0,
     limit: int = 50,
     response: Response = None,
-    db=Depends(get_db_dependency),
+    db=Depends(get_async_db_dependency),
 ):
     """Get list of interlinear texts"""
     try:
-        total = db.run(
+        total_result = await db.run(
             """
             MATCH (t:Text)
             WHERE ($language IS NULL OR t.language = $language)
             RETURN count(t) AS total
             """,
             language=language,
-        ).single()["total"]
+        )
+        total = (await total_result.single())["total"]
 
         cypher_query = """
             MATCH (t:Text)
@@ -849,9 +1068,11 @@ async def get_texts(
             SKIP $skip
             LIMIT $limit
         """
-        result = db.run(cypher_query, language=language, skip=skip, limit=limit)
+        result = await db.run(cypher_query, language=language, skip=skip, limit=limit)
 
-        texts = [InterlinearTextResponse(**dict(record)) for record in result]
+        # Drain the result as plain dicts and return them as-is; the query
+        # aliases and COALESCEs every field into the documented shape
+        texts = await result.data()
 
         response.headers["X-Total-Count"] = str(total)
         response.headers["X-Limit"] = str(limit)
@@ -863,58 +1084,84 @@ async def get_texts(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+async def _run_count(db, query: str) -> int:
+    """Run a single-row count query and return its value (0 when empty)"""
+    result = await db.run(query)
+    record = await result.single()
+    return (record["count"] if record else 0) or 0
+
+
+# All node counts in one statement: each CALL subquery is a trivial
+# count-store lookup server-side, so one round trip replaces six
+_NODE_COUNTS_CYPHER = """
+    CALL { MATCH (t:Text) RETURN count(t) AS text_count }
+    CALL { MATCH (s:Section) RETURN count(s) AS section_count }
+    CALL { MATCH (p:Phrase) RETURN count(p) AS phrase_count }
+    CALL { MATCH (w:Word) RETURN count(w) AS word_count }
+    CALL { MATCH (m:Morpheme) RETURN count(m) AS morpheme_count }
+    CALL { MATCH (g:Gloss) RETURN count(g) AS gloss_count }
+    RETURN text_count, section_count, phrase_count,
+           word_count, morpheme_count, gloss_count
+"""
+
+
 @router.get("/stats")
-async def get_database_stats(db=Depends(get_db_dependency)):
+async def get_database_stats(db=Depends(get_async_db_dependency)):
     """Get overall database statistics"""
-    try:
-        # Use separate queries to avoid timeout issues
-        text_count = (
-            db.run("MATCH (t:Text) RETURN count(t) as count").single()["count"] or 0
-        )
-        section_count = (
-            db.run("MATCH (s:Section) RETURN count(s) as count").single()["count"] or 0
-        )
-        phrase_count = (
-            db.run("MATCH (p:Phrase) RETURN count(p) as count").single()["count"] or 0
-        )
-        word_count = (
-            db.run("MATCH (w:Word) RETURN count(w) as count").single()["count"] or 0
-        )
-        morpheme_count = (
-            db.run("MATCH (m:Morpheme) RETURN count(m) as count").single()["count"] or 0
-        )
-        gloss_count = (
-            db.run("MATCH (g:Gloss) RETURN count(g) as count").single()["count"] or 0
-        )
 
-        # Count relationships - this can be expensive, so we'll make it optional
+    async def _node_counts():
+        result = await db.run(_NODE_COUNTS_CYPHER)
+        record = await result.single()
+        return dict(record) if record else {}
+
+    async def _relationship_count():
+        # Count relationships - unlike the per-label node counts this has no
+        # count-store entry, so prefer APOC's precomputed meta counters
+        # (O(1)) and only fall back to the exhaustive scan when APOC isn't
+        # installed. Runs on its own pooled session so it overlaps the
+        # node-count statement instead of queueing behind it.
         try:
-            relationship_count = (
-                db.run("MATCH ()-[r]->() RETURN count(r) as count").single()["count"]
-                or 0
-            )
+            async with database.async_driver.session(
+                database=settings.NEO4J_DATABASE
+            ) as session:
+                try:
+                    return await _run_count(
+                        session,
+                        "CALL apoc.meta.stats() YIELD relCount RETURN relCount as count",
+                    )
+                except Exception:
+                    return await _run_count(
+                        session, "MATCH ()-[r]->() RETURN count(r) as count"
+                    )
         except Exception:
             # If counting all relationships times out, estimate or skip
-            relationship_count = None
+            return None
+
+    async def _load():
+        counts, relationship_count = await asyncio.gather(
+            _node_counts(), _relationship_count()
+        )
 
         return {
-            "text_count": text_count,
-            "section_count": section_count,
-            "phrase_count": phrase_count,
-            "word_count": word_count,
-            "morpheme_count": morpheme_count,
-            "gloss_count": gloss_count,
+            "text_count": counts.get("text_count", 0),
+            "section_count": counts.get("section_count", 0),
+            "phrase_count": counts.get("phrase_count", 0),
+            "word_count": counts.get("word_count", 0),
+            "morpheme_count": counts.get("morpheme_count", 0),
+            "gloss_count": counts.get("gloss_count", 0),
             "relationship_count": relationship_count,
         }
 
+    try:
+        return await _cached_read(("stats",), _load)
+
     except Exception as e:
-        logger.error(f"Error fetching stats: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error fetching stats")
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/schema-visualization")
-async def get_schema_visualization(db=Depends(get_db_dependency)):
+async def get_schema_visualization(db=Depends(get_async_db_dependency)):
     """Get a sample of the graph structure for visualization"""
     try:
         return {
@@ -928,9 +1175,17 @@ async def get_schema_visualization(db=Depends(get_db_dependency)):
 
 
 @router.get("/graph-filters")
-async def get_graph_filters(db=Depends(get_db_dependency)):
-    """Get available filter options for graph visualization"""
-    try:
+async def get_graph_filters(
+    request: Request, response: Response, db=Depends(get_async_db_dependency)
+):
+    """Get available filter options for graph visualization.
+
+    Supports conditional GETs: the ETag tracks the graph write version, so a
+    client re-polling with If-None-Match gets an empty 304 until an upload or
+    wipe actually changes the filter options.
+    """
+
+    async def _load():
         # Get available texts
         texts_query = """
             MATCH (t:Text)
@@ -940,8 +1195,8 @@ async def get_graph_filters(db=Depends(get_db_dependency)):
             ORDER BY t.title
             LIMIT 50
         """
-        texts_result = db.run(texts_query)
-        texts = [dict(record) for record in texts_result]
+        texts_result = await db.run(texts_query)
+        texts = [dict(record) async for record in texts_result]
 
         # Get available languages
         languages_query = """
@@ -950,25 +1205,80 @@ async def get_graph_filters(db=Depends(get_db_dependency)):
             RETURN DISTINCT t.language as code
             ORDER BY code
         """
-        lang_result = db.run(languages_query)
-        languages = [record["code"] for record in lang_result if record["code"]]
+        lang_result = await db.run(languages_query)
+        languages = [record["code"] async for record in lang_result if record["code"]]
 
         return {
             "texts": texts,
             "languages": languages,
             "node_types": ["Text", "Section", "Phrase", "Word", "Morpheme", "Gloss"],
         }
+
+    etag = _graph_etag()
+    cache_headers = {"ETag": etag, "Cache-Control": "private, max-age=300"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=cache_headers)
+
+    try:
+        payload = await _cached_read(("graph-filters",), _load)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    response.headers.update(cache_headers)
+    return payload
+
 
-@router.get("/graph-data")
+def _styled_edge(index, source, target, rel_type):
+    """Edge dict in the shape the graph visualization expects.
+
+    Relationship type names arrive from Bolt as a fresh string per record;
+    interning collapses the few distinct values to shared objects so large
+    edge lists don't carry thousands of duplicate allocations.
+    """
+    return {
+        "id": f"edge-{index}",
+        "source": str(source),
+        "target": str(target),
+        "type": sys.intern(rel_type) if rel_type else "",
+        "size": 2,
+        "color": "#94a3b8",
+    }
+
+
+async def _stream_graph_edges(db, node_ids, edge_limit):
+    """Stream styled edge dicts between the given nodes, capped at edge_limit.
+
+    Streaming rows (instead of collect()-ing server-side) keeps the server
+    from materializing one giant list and Bolt message for dense subgraphs;
+    edges are appended as records arrive.
+    """
+    result = await db.run(
+        """
+        MATCH (n1)-[r]->(n2)
+        WHERE id(n1) IN $node_ids AND id(n2) IN $node_ids
+        RETURN id(n1) as source, id(n2) as target, type(r) as type
+        LIMIT $edge_limit
+        """,
+        node_ids=node_ids,
+        edge_limit=edge_limit,
+    )
+
+    edges = []
+    async for rec in result:
+        edges.append(_styled_edge(len(edges), rec["source"], rec["target"], rec["type"]))
+
+    if len(edges) >= edge_limit:
+        logger.warning("Edge list truncated at %d for graph-data request", edge_limit)
+    return edges
+
+
+@router.get("/graph-data", response_class=ORJSONResponse)
 async def get_graph_data(
     text_id: Optional[str] = None,
     language: Optional[str] = None,
     node_types: Optional[str] = None,  # Comma-separated: "Text,Word,Gloss"
     limit: int = GRAPH_DATA_DEFAULT_LIMIT,
-    db=Depends(get_db_dependency),
+    db=Depends(get_async_db_dependency),
 ):
     """Get graph data for visualization with nodes and edges
 
@@ -979,232 +1289,188 @@ async def get_graph_data(
         limit: Max nodes per type (default 200, clamped between 10 and 1000)
     """
     limit = max(GRAPH_DATA_MIN_LIMIT, min(limit, GRAPH_DATA_MAX_LIMIT))
+    # Cap how many edges one response may carry regardless of node density
+    edge_limit = min(5 * limit, GRAPH_DATA_MAX_EDGES)
 
-    # Helper class for creating record objects
-    class GraphRecord:
-        def __init__(self, nodes, edges):
-            self.data = {"allNodes": nodes, "allEdges": edges}
-
-        def __getitem__(self, key):
-            return self.data[key]
+    # Cached directly (rather than through _cached_read) to keep the long
+    # handler body flat; same TTL and invalidation as the other read caches
+    cache_key = ("graph-data", text_id, language, node_types, limit)
+    cached = _read_cache.get(cache_key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
 
     try:
         nodes = []
-        edges = []
 
         # Query to get all nodes and relationships
         # If text_id is provided, filter by that text, otherwise get a sample
         if text_id:
-            # Much simpler query - get nodes and edges separately
-            # First get all nodes related to this text
-            cypher_query = """
-                MATCH path = (t:Text {ID: $text_id})-[*0..3]->(n)
+            # Single round trip: collect the subtree's projected nodes, keep
+            # their ids server-side, and match edges among them in the same
+            # statement instead of shipping the id list back in a second query
+            cypher_query = f"""
+                MATCH path = (t:Text {{ID: $text_id}})-[*0..3]->(n)
                 WITH DISTINCT n as node
                 LIMIT $limit
-                RETURN collect(node) as allNodes
+                WITH collect({_node_projection("node")}) as allNodes,
+                     collect(id(node)) as nodeIds
+                OPTIONAL MATCH (n1)-[r]->(n2)
+                WHERE id(n1) IN nodeIds AND id(n2) IN nodeIds
+                WITH allNodes, n1, r, n2
+                LIMIT $edge_limit
+                RETURN allNodes,
+                       collect(CASE WHEN r IS NULL THEN NULL
+                               ELSE {{source: id(n1), target: id(n2), type: type(r)}} END) as edgeRows
             """
 
-            nodes_result = db.run(cypher_query, text_id=text_id, limit=limit * 5)
-            nodes_record = nodes_result.single()
+            nodes_result = await db.run(
+                cypher_query, text_id=text_id, limit=limit * 5, edge_limit=edge_limit
+            )
+            nodes_record = await nodes_result.single()
 
             if not nodes_record or not nodes_record["allNodes"]:
                 return {"nodes": [], "edges": []}
 
             all_node_objects = nodes_record["allNodes"]
-            node_ids = [node.id for node in all_node_objects if node is not None]
-
-            # Now get edges between these nodes
-            edges_query = """
-                MATCH (n1)-[r]->(n2)
-                WHERE id(n1) IN $node_ids AND id(n2) IN $node_ids
-                RETURN collect({
-                    source: id(n1),
-                    target: id(n2),
-                    type: type(r)
-                }) as allEdges
-            """
-            edges_result = db.run(edges_query, node_ids=node_ids)
-            edges_record = edges_result.single()
-
-            all_edges = edges_record["allEdges"] if edges_record else []
-
-            # Create a record structure for compatibility with rest of code
-            record = GraphRecord(all_node_objects, all_edges)
+            edges = [
+                _styled_edge(i, row["source"], row["target"], row["type"])
+                for i, row in enumerate(nodes_record["edgeRows"])
+            ]
+            if len(edges) >= edge_limit:
+                logger.warning(
+                    "Edge list truncated at %d for graph-data request", edge_limit
+                )
         else:
             # Parse node types filter - use simple query to get sample nodes
             allowed_types = set()
             if node_types:
                 allowed_types = set(t.strip() for t in node_types.split(","))
 
-            # Get sample nodes of each type separately (much simpler and faster)
-            all_node_objects = []
+            def _wants(label):
+                return not node_types or label in allowed_types
+
+            # Sample every requested label in one statement: each label is a
+            # UNION ALL arm, so the whole sample costs one round trip instead
+            # of one query per type
+            sample_blocks = []
+            if _wants("Text"):
+                sample_blocks.append(
+                    "CALL { MATCH (t:Text) WHERE $language IS NULL OR t.language = $language RETURN "
+                    + _node_projection("t")
+                    + " AS n LIMIT $limit } RETURN n"
+                )
+            if _wants("Section"):
+                sample_blocks.append(
+                    "CALL { MATCH (s:Section) RETURN "
+                    + _node_projection("s")
+                    + " AS n LIMIT $limit } RETURN n"
+                )
+            if _wants("Phrase"):
+                sample_blocks.append(
+                    "CALL { MATCH (ph:Phrase) RETURN "
+                    + _node_projection("ph")
+                    + " AS n LIMIT $limit } RETURN n"
+                )
+            if _wants("Word"):
+                sample_blocks.append(
+                    "CALL { MATCH (w:Word) WHERE $language IS NULL OR w.language = $language RETURN "
+                    + _node_projection("w")
+                    + " AS n LIMIT $limit } RETURN n"
+                )
+            if _wants("Morpheme"):
+                sample_blocks.append(
+                    "CALL { MATCH (m:Morpheme) WHERE $language IS NULL OR m.language = $language RETURN "
+                    + _node_projection("m")
+                    + " AS n LIMIT $limit } RETURN n"
+                )
+            if _wants("Gloss"):
+                sample_blocks.append(
+                    "CALL { MATCH (g:Gloss) RETURN "
+                    + _node_projection("g")
+                    + " AS n LIMIT $limit } RETURN n"
+                )
 
-            if not node_types or "Text" in allowed_types:
-                lang_filter = "WHERE t.language = $language" if language else ""
-                query = f"MATCH (t:Text) {lang_filter} RETURN t LIMIT $limit"
-                result = db.run(query, limit=limit, language=language)
-                all_node_objects.extend([record["t"] for record in result])
-
-            if not node_types or "Section" in allowed_types:
-                query = "MATCH (s:Section) RETURN s LIMIT $limit"
-                result = db.run(query, limit=limit)
-                all_node_objects.extend([record["s"] for record in result])
-
-            if not node_types or "Phrase" in allowed_types:
-                query = "MATCH (ph:Phrase) RETURN ph LIMIT $limit"
-                result = db.run(query, limit=limit)
-                all_node_objects.extend([record["ph"] for record in result])
-
-            if not node_types or "Word" in allowed_types:
-                lang_filter = "WHERE w.language = $language" if language else ""
-                query = f"MATCH (w:Word) {lang_filter} RETURN w LIMIT $limit"
-                result = db.run(query, limit=limit, language=language)
-                all_node_objects.extend([record["w"] for record in result])
-
-            if not node_types or "Morpheme" in allowed_types:
-                lang_filter = "WHERE m.language = $language" if language else ""
-                query = f"MATCH (m:Morpheme) {lang_filter} RETURN m LIMIT $limit"
-                result = db.run(query, limit=limit, language=language)
-                all_node_objects.extend([record["m"] for record in result])
-
-            if not node_types or "Gloss" in allowed_types:
-                query = "MATCH (g:Gloss) RETURN g LIMIT $limit"
-                result = db.run(query, limit=limit)
-                all_node_objects.extend([record["g"] for record in result])
+            all_node_objects = []
+            if sample_blocks:
+                result = await db.run(
+                    " UNION ALL ".join(sample_blocks),
+                    limit=limit,
+                    language=language,
+                )
+                all_node_objects = [record["n"] async for record in result]
 
             if not all_node_objects:
                 return {"nodes": [], "edges": []}
 
             # Get node IDs for edge query
-            node_ids = [node.id for node in all_node_objects if node is not None]
-
-            # Get edges between these nodes (simple query)
-            edges_query = """
-                MATCH (n1)-[r]->(n2)
-                WHERE id(n1) IN $node_ids AND id(n2) IN $node_ids
-                RETURN collect({
-                    source: id(n1),
-                    target: id(n2),
-                    type: type(r)
-                }) as allEdges
-            """
-            edges_result = db.run(edges_query, node_ids=node_ids)
-            edges_record = edges_result.single()
-
-            all_edges = edges_record["allEdges"] if edges_record else []
-
-            # Create a record structure for compatibility with rest of code
-            record = GraphRecord(all_node_objects, all_edges)
-
-        if not record:
-            # Return empty graph if no data
-            return {"nodes": [], "edges": []}
-
-        # Define colors for each node type
-        node_colors = {
-            "Text": "#f59e0b",  # amber
-            "Section": "#8b5cf6",  # purple
-            "Phrase": "#06b6d4",  # cyan
-            "Word": "#0ea5e9",  # blue
-            "Morpheme": "#10b981",  # green
-            "Gloss": "#ec4899",  # pink
-        }
+            node_ids = [
+                node["id"] for node in all_node_objects if node and node["id"] is not None
+            ]
 
-        # Define sizes for each node type (larger = more important in hierarchy)
-        node_sizes = {
-            "Text": 30,
-            "Section": 22,
-            "Phrase": 16,
-            "Word": 8,
-            "Morpheme": 6,
-            "Gloss": 7,
-        }
+            # Get edges between these nodes
+            edges = await _stream_graph_edges(db, node_ids, edge_limit)
 
         # Process nodes (track seen IDs to avoid duplicates)
-        all_nodes = record["allNodes"]
         seen_node_ids = set()
 
-        for node in all_nodes:
+        for node in all_node_objects:
             if node is None:
                 continue
 
-            # Skip duplicates
-            node_id = str(node.id)
-            if node_id in seen_node_ids:
+            # Skip duplicates, deduping on the raw integer id so duplicate
+            # rows never pay the str() conversion
+            nid = node["id"]
+            if nid is None or nid in seen_node_ids:
                 continue
-            seen_node_ids.add(node_id)
+            seen_node_ids.add(nid)
 
-            labels = list(node.labels)
-            if not labels:
+            node_type = node["label"]
+            if not node_type:
                 continue
-
-            node_type = labels[0]
-            node_props = dict(node)
-
-            # Get label text
-            label_text = node_props.get("ID", "")
-            if node_type == "Text":
-                label_text = node_props.get("title", label_text)
-            elif node_type == "Word":
-                label_text = node_props.get("surface_form", label_text)
-            elif node_type == "Morpheme":
-                label_text = node_props.get(
-                    "surface_form", node_props.get("citation_form", label_text)
-                )
-            elif node_type == "Gloss":
-                label_text = node_props.get("annotation", label_text)[
-                    :20
-                ]  # Truncate long glosses
-            elif node_type == "Phrase":
-                label_text = node_props.get("surface_text", label_text)[:30]
+            # Bolt decodes a fresh label string per row; intern so every node
+            # of the same type shares one object
+            node_type = sys.intern(node_type)
 
             nodes.append(
                 {
-                    "id": node_id,
-                    "label": label_text,
+                    "id": str(nid),
+                    "label": _label_for(node_type, node),
                     "type": node_type,
-                    "color": node_colors.get(node_type, "#64748b"),
-                    "size": node_sizes.get(node_type, 10),
-                    "properties": node_props,
+                    "color": NODE_COLORS.get(node_type, "#64748b"),
+                    "size": NODE_SIZES.get(node_type, 10),
+                    # Whitelisted display properties only; the full node no
+                    # longer crosses Bolt or goes to the browser
+                    "properties": {
+                        k: v
+                        for k, v in node.items()
+                        if k not in ("id", "label") and v is not None
+                    },
                 }
             )
 
-        # Process edges
-        all_edges = record["allEdges"]
-        for idx, edge in enumerate(all_edges):
-            if edge is None or edge.get("source") is None or edge.get("target") is None:
-                continue
-
-            edges.append(
-                {
-                    "id": f"edge-{idx}",
-                    "source": str(edge["source"]),
-                    "target": str(edge["target"]),
-                    "type": edge.get("type", ""),
-                    "size": 2,
-                    "color": "#94a3b8",
-                }
-            )
-
-        return {
+        payload = {
             "nodes": nodes,
             "edges": edges,
             "stats": {"node_count": len(nodes), "edge_count": len(edges)},
         }
+        _read_cache[cache_key] = (
+            time.monotonic() + READ_CACHE_TTL_SECONDS,
+            payload,
+        )
+        return payload
 
     except Exception as e:
-        logger.error(f"Error fetching graph data: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error fetching graph data")
         raise HTTPException(
             status_code=400, detail=f"Error fetching graph data: {str(e)}"
         )
 
 
-@router.get("/word-graph-data")
+@router.get("/word-graph-data", response_class=ORJSONResponse)
 async def get_word_graph_data(
     word: str,
     language: Optional[str] = None,
-    db=Depends(get_db_dependency),
+    db=Depends(get_async_db_dependency),
 ):
     """Get morphological graph data for a specific word
 
@@ -1223,61 +1489,14 @@ async def get_word_graph_data(
         nodes = []
         edges = []
 
-        # Define colors for each node type
-        node_colors = {
-            "Text": "#f59e0b",  # amber
-            "Section": "#8b5cf6",  # purple
-            "Phrase": "#06b6d4",  # cyan
-            "Word": "#0ea5e9",  # blue
-            "Morpheme": "#10b981",  # green
-            "Gloss": "#ec4899",  # pink
-        }
-
-        node_sizes = {
-            "Text": 30,
-            "Section": 22,
-            "Phrase": 16,
-            "Word": 10,
-            "Morpheme": 8,
-            "Gloss": 7,
-        }
-
-        # Find the word and its context
-        lang_filter = "AND w.language = $language" if language else ""
-
-        # Simple, direct query that gets everything step by step
-        cypher_query = f"""
-        MATCH (w:Word {{surface_form: $word}})
-        WHERE 1=1 {lang_filter}
-        
-        // Get context
-        OPTIONAL MATCH (t:Text)-[:SECTION_PART_OF_TEXT]->(s:Section)-[:PHRASE_IN_SECTION]->(ph:Phrase)-[:PHRASE_COMPOSED_OF]->(w)
-        
-        // Get target word morphemes
-        OPTIONAL MATCH (w)-[:WORD_MADE_OF]->(m:Morpheme)
-        
-        // Get target word glosses
-        OPTIONAL MATCH (w)-[:WORD_MADE_OF]->(m2:Morpheme)<-[:ANALYZES]-(g:Gloss)
-        
-        WITH w, t, s, ph, collect(DISTINCT m) as target_morphemes, collect(DISTINCT g) as target_glosses
-        
-        // Find related words - any word that shares at least one morpheme
-        OPTIONAL MATCH (w)-[:WORD_MADE_OF]->(shared:Morpheme)<-[:WORD_MADE_OF]-(related:Word)
-        WHERE related.ID <> w.ID
-        
-        WITH w, t, s, ph, target_morphemes, target_glosses, collect(DISTINCT related) as related_words
-        
-        RETURN w as target_word, 
-               t as text, 
-               s as section, 
-               ph as phrase,
-               target_morphemes,
-               target_glosses,
-               related_words
-        """
+        # Two cached query variants: with a language the map-syntax equality
+        # lets the planner hit the (surface_form, language) composite index
+        # in one probe; without it the single-property form is used. Each
+        # variant's text is stable, so both stay in Neo4j's plan cache.
+        cypher_query = _word_graph_cypher(language is not None)
 
-        result = db.run(cypher_query, word=word, language=language)
-        record = result.single()
+        result = await db.run(cypher_query, word=word, language=language)
+        record = await result.single()
 
         if not record or not record.get("target_word"):
             logger.warning(f"Word '{word}' not found in database")
@@ -1299,53 +1518,41 @@ async def get_word_graph_data(
         )
         logger.info(f"Target glosses: {len(target_glosses)}")
         logger.info(
-            f"Related words: {len(related_words)} - {[w.get('surface_form', '') if hasattr(w, 'get') else str(w) for w in related_words[:5]]}"
+            f"Related words: {len(related_words)}"
         )
 
         seen_node_ids = set()
         node_id_map = {}  # Map neo4j internal id to our string id
 
         def add_node(node_obj, node_type):
-            """Helper to add a node if not already seen"""
-            if node_obj is None:
+            """Helper to add a projected node map if not already seen"""
+            if node_obj is None or node_obj.get("id") is None:
                 return None
 
-            node_id = str(node_obj.id)
+            node_id = str(node_obj["id"])
             if node_id in seen_node_ids:
                 return node_id
 
             seen_node_ids.add(node_id)
-            node_props = dict(node_obj)
-
-            # Get label text
-            label_text = node_props.get("ID", "")
-            if node_type == "Text":
-                label_text = node_props.get("title", label_text)
-            elif node_type == "Word":
-                label_text = node_props.get("surface_form", label_text)
-            elif node_type == "Morpheme":
-                label_text = node_props.get(
-                    "surface_form", node_props.get("citation_form", label_text)
-                )
-            elif node_type == "Gloss":
-                label_text = node_props.get("annotation", label_text)[:20]
-            elif node_type == "Phrase":
-                label_text = node_props.get("surface_text", label_text)[:30]
-            elif node_type == "Section":
-                label_text = node_props.get("ID", label_text)
 
             nodes.append(
                 {
                     "id": node_id,
-                    "label": label_text,
+                    "label": _label_for(node_type, node_obj),
                     "type": node_type,
-                    "color": node_colors.get(node_type, "#64748b"),
-                    "size": node_sizes.get(node_type, 10),
-                    "properties": node_props,
+                    "color": NODE_COLORS.get(node_type, "#64748b"),
+                    "size": FOCUS_NODE_SIZES.get(node_type, 10),
+                    # Whitelisted display properties; whole nodes no longer
+                    # cross Bolt or go to the browser
+                    "properties": {
+                        k: v
+                        for k, v in node_obj.items()
+                        if k not in ("id", "label") and v is not None
+                    },
                 }
             )
 
-            node_id_map[node_obj.id] = node_id
+            node_id_map[node_obj["id"]] = node_id
             return node_id
 
         def add_edge(source_id, target_id, rel_type):
@@ -1373,11 +1580,11 @@ async def get_word_graph_data(
         target_word = record["target_word"]
         word_id = add_node(target_word, "Word")
         if word_id:
-            # Make the searched word larger
-            for node in nodes:
-                if node["id"] == word_id:
-                    node["size"] = 15
-                    node["color"] = "#3b82f6"  # Brighter blue for focus
+            # Make the searched word larger; it was the first node added, so
+            # restyle it in place rather than scanning the list for its id
+            focus_node = nodes[-1]
+            focus_node["size"] = 15
+            focus_node["color"] = "#3b82f6"  # Brighter blue for focus
 
         # Add context nodes (Text, Section, Phrase)
         text_node = record.get("text")
@@ -1388,13 +1595,15 @@ async def get_word_graph_data(
         section_id = add_node(section_node, "Section") if section_node else None
         phrase_id = add_node(phrase_node, "Phrase") if phrase_node else None
 
-        # Add edges for context hierarchy
-        if text_id and section_id:
-            add_edge(text_id, section_id, "SECTION_PART_OF_TEXT")
-        if section_id and phrase_id:
-            add_edge(section_id, phrase_id, "PHRASE_IN_SECTION")
-        if phrase_id and word_id:
-            add_edge(phrase_id, word_id, "PHRASE_COMPOSED_OF")
+        # Add edges for context hierarchy, one (source, target, type) entry
+        # per level instead of three copies of the same guard-and-append
+        for src_id, tgt_id, rel_type in (
+            (text_id, section_id, "SECTION_PART_OF_TEXT"),
+            (section_id, phrase_id, "PHRASE_IN_SECTION"),
+            (phrase_id, word_id, "PHRASE_COMPOSED_OF"),
+        ):
+            if src_id and tgt_id:
+                add_edge(src_id, tgt_id, rel_type)
 
         # Add target word morphemes and glosses
         morpheme_ids = []
@@ -1405,39 +1614,34 @@ async def get_word_graph_data(
                 m_id = add_node(morpheme, "Morpheme")
                 if m_id and word_id:
                     morpheme_ids.append(m_id)
-                    morpheme_id_map[morpheme.id] = m_id
+                    morpheme_id_map[morpheme["id"]] = m_id
                     add_edge(word_id, m_id, "WORD_MADE_OF")
                     logger.info(
                         f"Added morpheme: {morpheme.get('surface_form', 'unknown')}, edge from word {word_id} to morpheme {m_id}"
                     )
 
-        # Add glosses - query to find correct morpheme relationships
-        for gloss in target_glosses:
+        # Add glosses for the target word's morphemes; the analyzed morpheme
+        # ids arrived inline with each gloss, so no follow-up query is needed
+        for gloss_entry in target_glosses:
+            gloss = gloss_entry.get("node") if gloss_entry else None
             if gloss:
                 g_id = add_node(gloss, "Gloss")
                 if g_id:
-                    # Query which morpheme(s) this gloss analyzes
-                    gloss_morph_query = """
-                    MATCH (g:Gloss)-[:ANALYZES]->(m:Morpheme)
-                    WHERE id(g) = $gloss_id
-                    RETURN id(m) as morph_id
-                    """
-                    gm_result = db.run(gloss_morph_query, gloss_id=gloss.id)
-                    for gm_rec in gm_result:
-                        morph_graph_id = morpheme_id_map.get(gm_rec["morph_id"])
+                    for morph_id in gloss_entry.get("morph_ids") or []:
+                        morph_graph_id = morpheme_id_map.get(morph_id)
                         if morph_graph_id:
                             add_edge(g_id, morph_graph_id, "ANALYZES")
                             logger.info(
                                 f"Added gloss edge from {g_id} to morpheme {morph_graph_id}"
                             )
 
-        # Process related words - get their full data
-        related_word_count = 0
-        for rel_word in related_words:
-            if not rel_word or related_word_count >= 10:
-                break
+        # Process related words; morphemes and glosses were expanded inline
+        # by the main query
+        for rel_entry in related_words:
+            rel_word = rel_entry.get("node") if rel_entry else None
+            if not rel_word:
+                continue
 
-            # Add related word node
             rw_id = add_node(rel_word, "Word")
             if not rw_id:
                 continue
@@ -1445,78 +1649,45 @@ async def get_word_graph_data(
             logger.info(
                 f"Adding related word: {rel_word.get('surface_form', 'unknown')}"
             )
-            related_word_count += 1
-
-            # Query to get this word's morphemes and glosses
-            rel_word_query = """
-            MATCH (w:Word)-[:WORD_MADE_OF]->(m:Morpheme)
-            WHERE id(w) = $word_id
-            OPTIONAL MATCH (g:Gloss)-[:ANALYZES]->(m)
-            RETURN collect(DISTINCT m) as morphemes, collect(DISTINCT g) as glosses
-            """
-            rw_result = db.run(rel_word_query, word_id=rel_word.id)
-            rw_record = rw_result.single()
-
-            if rw_record:
-                rw_morphemes = rw_record.get("morphemes", [])
-                rw_glosses = rw_record.get("glosses", [])
-                rw_morph_id_map = {}
-
-                # Add morphemes for this related word
-                for rw_morph in rw_morphemes:
-                    if rw_morph:
-                        rwm_id = add_node(rw_morph, "Morpheme")
-                        if rwm_id:
-                            rw_morph_id_map[rw_morph.id] = rwm_id
-                            add_edge(rw_id, rwm_id, "WORD_MADE_OF")
-                            logger.info(
-                                f"Added morpheme for related word: {rw_morph.get('surface_form', 'unknown')}"
-                            )
 
-                # Add glosses for this related word
-                for rw_gloss in rw_glosses:
-                    if rw_gloss:
-                        rwg_id = add_node(rw_gloss, "Gloss")
-                        if rwg_id:
-                            # Find which morpheme this gloss analyzes
-                            rwg_morph_query = """
-                            MATCH (g:Gloss)-[:ANALYZES]->(m:Morpheme)
-                            WHERE id(g) = $gloss_id
-                            RETURN id(m) as morph_id
-                            """
-                            rwgm_result = db.run(rwg_morph_query, gloss_id=rw_gloss.id)
-                            for rwgm_rec in rwgm_result:
-                                rwm_graph_id = rw_morph_id_map.get(rwgm_rec["morph_id"])
-                                if rwm_graph_id:
-                                    add_edge(rwg_id, rwm_graph_id, "ANALYZES")
-
-        # Validate edges before returning
-        node_id_set = {n["id"] for n in nodes}
-        valid_edges = []
-
-        for edge in edges:
-            source = edge.get("source")
-            target = edge.get("target")
-
-            if source in node_id_set and target in node_id_set:
-                valid_edges.append(edge)
-            else:
-                logger.warning(
-                    f"Skipping invalid edge: {edge['id']} - source={source} (exists={source in node_id_set}), target={target} (exists={target in node_id_set})"
-                )
+            rw_morph_id_map = {}
+
+            # Add morphemes for this related word
+            for rw_morph in rel_entry.get("morphemes") or []:
+                if rw_morph:
+                    rwm_id = add_node(rw_morph, "Morpheme")
+                    if rwm_id:
+                        rw_morph_id_map[rw_morph["id"]] = rwm_id
+                        add_edge(rw_id, rwm_id, "WORD_MADE_OF")
+                        logger.info(
+                            f"Added morpheme for related word: {rw_morph.get('surface_form', 'unknown')}"
+                        )
 
+            # Add glosses for this related word
+            for rw_gloss_entry in rel_entry.get("glosses") or []:
+                rw_gloss = rw_gloss_entry.get("node") if rw_gloss_entry else None
+                if rw_gloss:
+                    rwg_id = add_node(rw_gloss, "Gloss")
+                    if rwg_id:
+                        for morph_id in rw_gloss_entry.get("morph_ids") or []:
+                            rwm_graph_id = rw_morph_id_map.get(morph_id)
+                            if rwm_graph_id:
+                                add_edge(rwg_id, rwm_graph_id, "ANALYZES")
+
+        # Edges are built exclusively from node ids returned by add_node, so
+        # every endpoint is guaranteed to exist; no revalidation pass needed
         logger.info(
-            f"Returning {len(nodes)} nodes and {len(valid_edges)} valid edges (filtered {len(edges) - len(valid_edges)} invalid) for word '{word}'"
+            f"Returning {len(nodes)} nodes and {len(edges)} edges for word '{word}'"
         )
         logger.info(f"Node types: {[n['type'] for n in nodes]}")
-        logger.info(f"Sample edges: {valid_edges[:3] if valid_edges else 'none'}")
+        logger.info(f"Sample edges: {edges[:3] if edges else 'none'}")
 
         return {
             "nodes": nodes,
-            "edges": valid_edges,
+            "edges": edges,
             "stats": {
                 "node_count": len(nodes),
-                "edge_count": len(valid_edges),
+                "edge_count": len(edges),
                 "searched_word": word,
                 "morpheme_count": len([n for n in nodes if n["type"] == "Morpheme"]),
                 "related_word_count": len([n for n in nodes if n["type"] == "Word"])
@@ -1525,18 +1696,17 @@ async def get_word_graph_data(
         }
 
     except Exception as e:
-        logger.error(f"Error fetching word graph data: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error fetching word graph data for %s", word)
         raise HTTPException(
             status_code=400, detail=f"Error fetching word graph data: {str(e)}"
         )
 
 
-@router.get("/morpheme-graph-data")
+@router.get("/morpheme-graph-data", response_class=ORJSONResponse)
 async def get_morpheme_graph_data(
     morpheme: str,
     language: Optional[str] = None,
-    db=Depends(get_db_dependency),
+    db=Depends(get_async_db_dependency),
 ):
     """Get graph data for a specific morpheme
 
@@ -1553,39 +1723,21 @@ async def get_morpheme_graph_data(
     try:
         nodes = []
         edges = []
-
-        # Define colors for each node type
-        node_colors = {
-            "Text": "#f59e0b",  # amber
-            "Section": "#8b5cf6",  # purple
-            "Phrase": "#06b6d4",  # cyan
-            "Word": "#0ea5e9",  # blue
-            "Morpheme": "#10b981",  # green
-            "Gloss": "#ec4899",  # pink
-        }
-
-        node_sizes = {
-            "Text": 30,
-            "Section": 22,
-            "Phrase": 16,
-            "Word": 10,
-            "Morpheme": 8,
-            "Gloss": 7,
-        }
-
-        # Find the morpheme and related data
-        # Search in both surface_form and citation_form fields (case-insensitive)
-        if language:
-            lang_filter = "AND m.language = $language"
-        else:
-            lang_filter = ""
-
-        cypher_query = f"""
+        # O(1) duplicate checks for edges, mirroring node_id_set below
+        edge_id_set = set()
+
+        # Find the morpheme and related data in a single statement — glosses
+        # and containing words ride along as collected lists, so there is no
+        # follow-up round trip for linkage.
+        # Search in both surface_form and citation_form fields (case-insensitive).
+        # The language filter is a null check so the query text (and its
+        # cached plan) is the same whether or not a language is given.
+        cypher_query = """
         // Find all morpheme nodes matching the search term
         MATCH (m:Morpheme)
-        WHERE (toLower(m.surface_form) CONTAINS toLower($morpheme) 
+        WHERE (toLower(m.surface_form) CONTAINS toLower($morpheme)
            OR toLower(m.citation_form) CONTAINS toLower($morpheme))
-        {lang_filter}
+        AND ($language IS NULL OR m.language = $language)
         
         WITH collect(DISTINCT m) as all_morphemes
         
@@ -1596,19 +1748,23 @@ async def get_morpheme_graph_data(
         OPTIONAL MATCH (target_morpheme)<-[:ANALYZES]-(g:Gloss)
         WITH target_morpheme, all_morphemes, collect(DISTINCT g) as morpheme_glosses
         
-        // Get all words containing ANY of these morphemes
+        // Get words containing ANY of these morphemes, capped server-side so
+        // only the nodes that will be drawn cross the wire
         UNWIND all_morphemes as m
         OPTIONAL MATCH (w:Word)-[:WORD_MADE_OF]->(m)
-        WITH target_morpheme, morpheme_glosses, collect(DISTINCT w) as related_words
+        WITH target_morpheme, morpheme_glosses,
+             collect(DISTINCT w)[0..50] as related_words
         
-        // Return just the essential data for sunburst visualization
-        RETURN target_morpheme,
-               morpheme_glosses,
-               related_words
+        // Return just the essential data for sunburst visualization; map
+        // projections send plain property maps instead of full Bolt nodes,
+        // limited to the fields the view reads
+        RETURN target_morpheme {.ID, .surface_form, .citation_form, .gloss, .language} as target_morpheme,
+               [g IN morpheme_glosses | g {.ID, .annotation, .value, .gloss, .language}] as morpheme_glosses,
+               [w IN related_words | w {.ID, .surface_form, .language}] as related_words
         """
 
-        result = db.run(cypher_query, morpheme=morpheme, language=language)
-        record = result.single()
+        result = await db.run(cypher_query, morpheme=morpheme, language=language)
+        record = await result.single()
 
         if not record or not record.get("target_morpheme"):
             logger.warning(f"Morpheme '{morpheme}' not found in database")
@@ -1631,8 +1787,10 @@ async def get_morpheme_graph_data(
             f"Sample related words: {[w.get('surface_form', 'N/A') for w in related_words[:5]]}"
         )
 
-        # Build nodes list
+        # Build nodes list; per-type tallies are kept as nodes are appended so
+        # the stats block doesn't re-scan the list per type at return time
         node_id_set = set()
+        type_counts = Counter()
 
         # Add target morpheme
         if target_morpheme:
@@ -1648,12 +1806,23 @@ async def get_morpheme_graph_data(
                     "id": morpheme_id,
                     "label": morpheme_form,
                     "type": "Morpheme",
-                    "color": node_colors["Morpheme"],
-                    "size": node_sizes["Morpheme"] * 1.5,  # Make target larger
-                    "properties": dict(target_morpheme),
+                    "color": NODE_COLORS["Morpheme"],
+                    "size": FOCUS_NODE_SIZES["Morpheme"] * 1.5,  # Make target larger
+                    "properties": {
+                        k: v for k, v in target_morpheme.items() if v is not None
+                    },
                 }
             )
             node_id_set.add(morpheme_id)
+            type_counts["Morpheme"] += 1
+
+        # Hoist the per-type style lookups out of the assembly loops; the
+        # loop bodies then touch only locals, which is as much interpreter
+        # overhead as can be shaved without leaving pure Python
+        gloss_color = NODE_COLORS["Gloss"]
+        gloss_size = FOCUS_NODE_SIZES["Gloss"]
+        word_color = NODE_COLORS["Word"]
+        word_size = FOCUS_NODE_SIZES["Word"]
 
         # Add glosses
         for gloss_node in morpheme_glosses:
@@ -1672,28 +1841,34 @@ async def get_morpheme_graph_data(
                             "id": gloss_id,
                             "label": gloss_label,
                             "type": "Gloss",
-                            "color": node_colors["Gloss"],
-                            "size": node_sizes["Gloss"],
-                            "properties": dict(gloss_node),
+                            "color": gloss_color,
+                            "size": gloss_size,
+                            "properties": {
+                                k: v for k, v in gloss_node.items() if v is not None
+                            },
                         }
                     )
                     node_id_set.add(gloss_id)
+                    type_counts["Gloss"] += 1
 
                     # Add edge from gloss to morpheme
-                    edges.append(
-                        {
-                            "id": f"{gloss_id}-analyzes-{morpheme_id}",
-                            "source": gloss_id,
-                            "target": morpheme_id,
-                            "type": "ANALYZES",
-                            "color": "#60a5fa",
-                            "size": 2,
-                        }
-                    )
+                    edge_id = f"{gloss_id}-analyzes-{morpheme_id}"
+                    if edge_id not in edge_id_set:
+                        edge_id_set.add(edge_id)
+                        edges.append(
+                            {
+                                "id": edge_id,
+                                "source": gloss_id,
+                                "target": morpheme_id,
+                                "type": "ANALYZES",
+                                "color": "#60a5fa",
+                                "size": 2,
+                            }
+                        )
 
-        # Add related words (show all up to 50)
-        logger.info(f"Adding {len(related_words[:50])} words to graph")
-        for word_node in related_words[:50]:
+        # Add related words (already capped at 50 in the query)
+        logger.info(f"Adding {len(related_words)} words to graph")
+        for word_node in related_words:
             if word_node:
                 word_id = str(word_node.get("ID"))
                 if word_id not in node_id_set:
@@ -1702,100 +1877,124 @@ async def get_morpheme_graph_data(
                             "id": word_id,
                             "label": word_node.get("surface_form", ""),
                             "type": "Word",
-                            "color": node_colors["Word"],
-                            "size": node_sizes["Word"],
-                            "properties": dict(word_node),
+                            "color": word_color,
+                            "size": word_size,
+                            "properties": {
+                                k: v for k, v in word_node.items() if v is not None
+                            },
                         }
                     )
                     node_id_set.add(word_id)
+                    type_counts["Word"] += 1
 
                     # Add edge from word to morpheme
-                    edges.append(
-                        {
-                            "id": f"{word_id}-made-of-{morpheme_id}",
-                            "source": word_id,
-                            "target": morpheme_id,
-                            "type": "WORD_MADE_OF",
-                            "color": "#60a5fa",
-                            "size": 2,
-                        }
-                    )
+                    edge_id = f"{word_id}-made-of-{morpheme_id}"
+                    if edge_id not in edge_id_set:
+                        edge_id_set.add(edge_id)
+                        edges.append(
+                            {
+                                "id": edge_id,
+                                "source": word_id,
+                                "target": morpheme_id,
+                                "type": "WORD_MADE_OF",
+                                "color": "#60a5fa",
+                                "size": 2,
+                            }
+                        )
 
         # Skip context nodes (texts, sections, phrases) for simpler visualization
         # Only show Words, Morpheme, and Glosses
 
-        # Validate edges
-        valid_edges = []
-        for edge in edges:
-            source = edge.get("source")
-            target = edge.get("target")
-
-            if source in node_id_set and target in node_id_set:
-                valid_edges.append(edge)
-            else:
-                logger.warning(f"Skipping invalid edge: {edge['id']}")
-
+        # Every edge is appended right after both of its endpoints entered
+        # node_id_set, so edges are valid by construction and need no
+        # revalidation pass
         logger.info(
-            f"Returning {len(nodes)} nodes and {len(valid_edges)} valid edges for morpheme '{morpheme}'"
+            f"Returning {len(nodes)} nodes and {len(edges)} edges for morpheme '{morpheme}'"
         )
 
         return {
             "nodes": nodes,
-            "edges": valid_edges,
+            "edges": edges,
             "stats": {
                 "node_count": len(nodes),
-                "edge_count": len(valid_edges),
+                "edge_count": len(edges),
                 "searched_morpheme": morpheme,
-                "related_word_count": len([n for n in nodes if n["type"] == "Word"]),
-                "gloss_count": len([n for n in nodes if n["type"] == "Gloss"]),
+                "related_word_count": type_counts["Word"],
+                "gloss_count": type_counts["Gloss"],
             },
         }
 
     except Exception as e:
-        logger.error(f"Error fetching morpheme graph data: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error fetching morpheme graph data for %s", morpheme)
         raise HTTPException(
             status_code=400, detail=f"Error fetching morpheme graph data: {str(e)}"
         )
 
 
 @router.delete("/wipe-database")
-async def wipe_database(db=Depends(get_db_dependency)):
+async def wipe_database(db=Depends(get_async_db_dependency)):
     """Wipe all linguistic data from the database
 
     WARNING: This will permanently delete all texts, sections, phrases, words,
     morphemes, and glosses from the database. This action cannot be undone.
     """
     try:
-        # Delete all nodes and relationships in the correct order to avoid constraint violations
-        wipe_queries = [
-            # Delete all relationships first
-            "MATCH ()-[r]-() DELETE r",
-            # Delete all nodes
-            "MATCH (n) DELETE n",
-        ]
-
-        deleted_counts = {}
-
-        # Get counts before deletion for reporting
-        count_queries = {
-            "texts": "MATCH (t:Text) RETURN count(t) as count",
-            "sections": "MATCH (s:Section) RETURN count(s) as count",
-            "phrases": "MATCH (p:Phrase) RETURN count(p) as count",
-            "words": "MATCH (w:Word) RETURN count(w) as count",
-            "morphemes": "MATCH (m:Morpheme) RETURN count(m) as count",
-            "glosses": "MATCH (g:Gloss) RETURN count(g) as count",
-            "relationships": "MATCH ()-[r]-() RETURN count(r) as count",
-        }
-
-        for entity_type, query in count_queries.items():
-            result = db.run(query)
-            record = result.single()
-            deleted_counts[entity_type] = record["count"] if record else 0
+        # Snapshot counts for reporting. APOC's meta counters return every
+        # label count plus the relationship total in one constant-time read;
+        # without APOC, fall back to one statement of CALL {} count-store
+        # subqueries (same fusion as the /stats endpoint).
+        try:
+            result = await db.run(
+                "CALL apoc.meta.stats() YIELD labels, relCount "
+                "RETURN labels, relCount"
+            )
+            record = await result.single()
+            labels = record["labels"] if record else {}
+            deleted_counts = {
+                "texts": labels.get("Text", 0),
+                "sections": labels.get("Section", 0),
+                "phrases": labels.get("Phrase", 0),
+                "words": labels.get("Word", 0),
+                "morphemes": labels.get("Morpheme", 0),
+                "glosses": labels.get("Gloss", 0),
+                "relationships": record["relCount"] if record else 0,
+            }
+        except Exception:
+            counts_query = """
+                CALL { MATCH (t:Text) RETURN count(t) AS texts }
+                CALL { MATCH (s:Section) RETURN count(s) AS sections }
+                CALL { MATCH (p:Phrase) RETURN count(p) AS phrases }
+                CALL { MATCH (w:Word) RETURN count(w) AS words }
+                CALL { MATCH (m:Morpheme) RETURN count(m) AS morphemes }
+                CALL { MATCH (g:Gloss) RETURN count(g) AS glosses }
+                CALL { MATCH ()-[r]->() RETURN count(r) AS relationships }
+                RETURN texts, sections, phrases, words, morphemes, glosses,
+                       relationships
+            """
+            result = await db.run(counts_query)
+            record = await result.single()
+            deleted_counts = dict(record) if record else {}
+
+        # Delete in bounded batches so the transaction log stays small on
+        # large graphs; fall back to one monolithic DETACH DELETE when APOC
+        # isn't installed. Batches are serial (parallel: false) because
+        # concurrent deletes would fight over relationship locks.
+        try:
+            result = await db.run(
+                """
+                CALL apoc.periodic.iterate(
+                    'MATCH (n) RETURN n',
+                    'DETACH DELETE n',
+                    {batchSize: 10000, parallel: false}
+                )
+                """
+            )
+            await result.consume()
+        except Exception:
+            result = await db.run("MATCH (n) DETACH DELETE n")
+            await result.consume()
 
-        # Execute wipe queries
-        for query in wipe_queries:
-            db.run(query)
+        _invalidate_read_cache()
 
         return {
             "message": "Database wiped successfully",
@@ -4,7 +4,7 @@ from typing import Optional, List, Dict
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class MorphemeExport:
     """Morpheme data for export."""
     ID: str
@@ -17,7 +17,7 @@ class MorphemeExport:
     original_guid: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WordExport:
     """Word data for export."""
     ID: str
@@ -30,7 +30,7 @@ class WordExport:
     is_punctuation: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PhraseExport:
     """Phrase data for export."""
     ID: str
@@ -41,7 +41,7 @@ class PhraseExport:
     order: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionExport:
     """Section (paragraph) data for export."""
     ID: str
@@ -49,7 +49,7 @@ class SectionExport:
     phrases: List[PhraseExport]
 
 
-@dataclass
+@dataclass(slots=True)
 class TextExport:
     """Complete text data for export."""
     ID: str
@@ -10,7 +10,7 @@ load_dotenv()
 
 # Import routers
 from app.routers import auth, languages, documentation, linguistic, export
-from app.database import init_neo4j, close_neo4j
+from app.database import init_neo4j, close_neo4j, aclose_neo4j
 from app.core.config import settings
 
 
@@ -23,6 +23,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     print("Shutting down Lexiconnect API...")
     close_neo4j()
+    await aclose_neo4j()
 
 
 app = FastAPI(
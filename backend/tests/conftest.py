@@ -0,0 +1,11 @@
+"""Shared pytest setup for the backend test suite.
+
+Makes the backend package root (the directory holding ``app``) importable
+once per session, replacing the per-file ``sys.path.insert`` boilerplate
+that every test module used to re-run at collection time.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -1,15 +1,10 @@
 """Unit tests for FLEXText export conversion service."""
 
-import os
-import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "backend"))
-
-from app.parsers.flextext_parser import parse_flextext_file  # noqa: E402
-from app.services.export_flextext_service import generate_flextext_xml  # noqa: E402
+from app.parsers.flextext_parser import parse_flextext_file
+from app.services.export_flextext_service import generate_flextext_xml
 
 
 def _mock_graph_data():
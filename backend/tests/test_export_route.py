@@ -1,19 +1,13 @@
 """Tests for the export endpoints."""
 
 import json
-import os
-import sys
 import xml.etree.ElementTree as ET
 from unittest.mock import ANY, MagicMock, patch
 
 from fastapi.testclient import TestClient
 
-
-# Ensure backend package is importable when running tests from repository root
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "backend"))
-
-from main import app  # noqa: E402  # isort:skip
-from app.database import get_db_dependency  # noqa: E402  # isort:skip
+from main import app  # isort:skip
+from app.database import get_db_dependency  # isort:skip
 
 
 class _StubSession:
@@ -1,144 +1,311 @@
 """
 Test script to debug missing edges between Gloss, Morpheme, and Word nodes
 """
-import sys
-import os
+import pytest
+from neo4j import GraphDatabase
 
-# Add the backend directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
+from app.core.config import settings
+from app.database import SCHEMA_CONSTRAINTS, SCHEMA_INDEXES
 
-from app.database import Neo4jDatabase
-from app.core.config import get_settings
 
-settings = get_settings()
+@pytest.fixture(scope="module")
+def neo4j_session():
+    """One driver and one session shared by every query in this module.
 
-def test_gloss_relationships():
-    """Check if ANALYZES relationships exist in the database"""
-    
-    db = Neo4jDatabase(
-        uri=settings.neo4j_uri,
-        user=settings.neo4j_user,
-        password=settings.neo4j_password
+    Reusing the driver amortizes the TCP/TLS handshake across all checks,
+    and pinning database= skips the per-query home-database lookup.
+    """
+    driver = GraphDatabase.driver(
+        settings.NEO4J_URI,
+        auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
     )
-    
     try:
-        # Test 1: Count Gloss nodes
-        result = db.run("MATCH (g:Gloss) RETURN count(g) as count")
-        gloss_count = result.single()["count"]
-        print(f"✓ Found {gloss_count} Gloss nodes")
-        
-        # Test 2: Count Word nodes
-        result = db.run("MATCH (w:Word) RETURN count(w) as count")
-        word_count = result.single()["count"]
-        print(f"✓ Found {word_count} Word nodes")
-        
-        # Test 3: Count Morpheme nodes
-        result = db.run("MATCH (m:Morpheme) RETURN count(m) as count")
-        morpheme_count = result.single()["count"]
-        print(f"✓ Found {morpheme_count} Morpheme nodes")
-        
-        # Test 4: Count ANALYZES relationships
-        result = db.run("MATCH ()-[r:ANALYZES]->() RETURN count(r) as count")
-        analyzes_count = result.single()["count"]
-        print(f"✓ Found {analyzes_count} ANALYZES relationships")
-        
-        # Test 5: Check Gloss -> Word relationships
-        result = db.run("""
-            MATCH (g:Gloss)-[r:ANALYZES]->(w:Word) 
-            RETURN count(r) as count
-        """)
-        gloss_word_count = result.single()["count"]
-        print(f"  - {gloss_word_count} Gloss→Word ANALYZES relationships")
-        
-        # Test 6: Check Gloss -> Morpheme relationships
-        result = db.run("""
-            MATCH (g:Gloss)-[r:ANALYZES]->(m:Morpheme) 
-            RETURN count(r) as count
-        """)
-        gloss_morph_count = result.single()["count"]
-        print(f"  - {gloss_morph_count} Gloss→Morpheme ANALYZES relationships")
-        
-        # Test 7: Sample some actual relationships
-        if analyzes_count > 0:
-            print("\nSample ANALYZES relationships:")
-            result = db.run("""
-                MATCH (g:Gloss)-[r:ANALYZES]->(target)
-                RETURN 
-                    labels(g)[0] as source_type,
-                    g.annotation as gloss_text,
-                    labels(target)[0] as target_type,
-                    CASE 
-                        WHEN target:Word THEN target.surface_form
-                        WHEN target:Morpheme THEN target.surface_form
-                        ELSE 'N/A'
-                    END as target_text
-                LIMIT 5
-            """)
-            for record in result:
-                print(f"  - {record['source_type']}('{record['gloss_text']}') → {record['target_type']}('{record['target_text']}')")
-        
-        # Test 8: Check Word -> Morpheme relationships
+        with driver.session(database=settings.NEO4J_DATABASE) as session:
+            yield session
+    finally:
+        driver.close()
+
+
+def _plan_operators(plan):
+    """Flatten an EXPLAIN plan tree into a list of operator types."""
+    operators = []
+    stack = [plan]
+    while stack:
+        node = stack.pop()
+        if not node:
+            continue
+        operators.append(node.get("operatorType", ""))
+        stack.extend(node.get("children") or [])
+    return operators
+
+
+def test_text_lookup_uses_index_seek(neo4j_session):
+    """Fail if the text-anchored lookup regresses to a label scan.
+
+    EXPLAIN compiles the plan without touching data, so this runs in
+    milliseconds yet catches the exact regression that turns every graph
+    request into a full NodeByLabelScan over Text.
+    """
+    # Preflight: the same statements app startup runs, so the plan is
+    # meaningful even against a bare database
+    for statement in SCHEMA_CONSTRAINTS + SCHEMA_INDEXES:
+        neo4j_session.run(statement)
+
+    summary = neo4j_session.run(
+        "EXPLAIN MATCH (t:Text {ID: $text_id}) "
+        "OPTIONAL MATCH (t)-[:SECTION_PART_OF_TEXT]->(s:Section) "
+        "RETURN t, collect(s) AS sections",
+        text_id="plan-check",
+    ).consume()
+
+    operators = _plan_operators(summary.plan)
+    assert not any("NodeByLabelScan" in op for op in operators), (
+        f"Text lookup fell back to a label scan: {operators}"
+    )
+    assert any("IndexSeek" in op for op in operators), (
+        f"Expected an index seek on Text.ID, got: {operators}"
+    )
+
+
+class _FakeResult:
+    def __init__(self, records):
+        self._records = iter(records)
+
+    def single(self):
+        return next(self._records, None)
+
+    def __iter__(self):
+        return self._records
+
+
+# Canned records for the three statements _check_gloss_relationships runs,
+# keyed by a query fingerprint. Mirrors the _FakeSession approach in
+# test_neo4j_service so the checks run hermetically, without Neo4j.
+_CANNED_COUNTS = {
+    "gloss_count": 4,
+    "word_count": 3,
+    "morpheme_count": 2,
+    "analyzes_count": 5,
+    "gloss_word_count": 3,
+    "gloss_morph_count": 2,
+    "word_morph_count": 2,
+}
+
+_CANNED_SAMPLES = [
+    {
+        "source_type": "Gloss",
+        "gloss_text": "HELLO",
+        "target_type": "Word",
+        "target_text": "hello",
+    },
+    {
+        "source_type": "Gloss",
+        "gloss_text": "GOOD",
+        "target_type": "Morpheme",
+        "target_text": "good",
+    },
+]
+
+_CANNED_GRAPH_DATA = {
+    "word_count": 3,
+    "morpheme_count": 2,
+    "gloss_word_count": 3,
+    "gloss_morpheme_count": 2,
+}
+
+
+class _FakeGlossSession:
+    def run(self, query, **params):
+        if "gloss_morph_count" in query:
+            return _FakeResult([_CANNED_COUNTS])
+        if "ANALYZES]->(target)" in query:
+            return _FakeResult(_CANNED_SAMPLES)
+        if "allMorphemes" in query:
+            return _FakeResult([_CANNED_GRAPH_DATA])
+        raise AssertionError(f"Unexpected query dispatched: {query}")
+
+
+def test_gloss_relationships_hermetic():
+    """Run the relationship checks against canned records and assert on them.
+
+    The live-DB variant below only prints its findings; this one actually
+    fails if the counts stop adding up, and runs in-process without Neo4j.
+    """
+    counts = _check_gloss_relationships(_FakeGlossSession())
+
+    assert counts["analyzes_count"] > 0
+    assert counts["gloss_word_count"] + counts["gloss_morph_count"] > 0
+    assert (
+        counts["gloss_word_count"] + counts["gloss_morph_count"]
+        == counts["analyzes_count"]
+    ), "Every ANALYZES relationship should target a Word or a Morpheme"
+
+
+# Each count is independent, so parametrizing them lets pytest-xdist spread
+# the round trips across workers and makes a single broken count visible in
+# CI output by name instead of buried in the combined diagnostic below.
+# Every query here is served from Neo4j's count store.
+_COUNT_QUERIES = [
+    pytest.param("MATCH (g:Gloss) RETURN count(g) AS c", id="gloss-nodes"),
+    pytest.param("MATCH (w:Word) RETURN count(w) AS c", id="word-nodes"),
+    pytest.param("MATCH (m:Morpheme) RETURN count(m) AS c", id="morpheme-nodes"),
+    pytest.param("MATCH ()-[r:ANALYZES]->() RETURN count(r) AS c", id="analyzes-rels"),
+    pytest.param(
+        "MATCH (:Gloss)-[r:ANALYZES]->(:Word) RETURN count(r) AS c",
+        id="gloss-word-rels",
+    ),
+    pytest.param(
+        "MATCH (:Gloss)-[r:ANALYZES]->(:Morpheme) RETURN count(r) AS c",
+        id="gloss-morpheme-rels",
+    ),
+    pytest.param(
+        "MATCH (:Word)-[r:WORD_MADE_OF]->(:Morpheme) RETURN count(r) AS c",
+        id="word-morpheme-rels",
+    ),
+]
+
+
+@pytest.mark.parametrize("query", _COUNT_QUERIES)
+def test_count_query(neo4j_session, query):
+    assert neo4j_session.run(query).single()["c"] >= 0
+
+
+def test_gloss_relationships(neo4j_session):
+    """Check if ANALYZES relationships exist in the database"""
+    _check_gloss_relationships(neo4j_session)
+
+
+def _check_gloss_relationships(db):
+    # Tests 1-6 + 8: all summary counts in one statement (one bolt round
+    # trip instead of seven); each CALL {} subquery is served from the
+    # count store or a single relationship expand
+    result = db.run("""
+        CALL { MATCH (g:Gloss) RETURN count(g) as gloss_count }
+        CALL { MATCH (w:Word) RETURN count(w) as word_count }
+        CALL { MATCH (m:Morpheme) RETURN count(m) as morpheme_count }
+        CALL { MATCH ()-[r:ANALYZES]->() RETURN count(r) as analyzes_count }
+        CALL { MATCH (:Gloss)-[r:ANALYZES]->(:Word) RETURN count(r) as gloss_word_count }
+        CALL { MATCH (:Gloss)-[r:ANALYZES]->(:Morpheme) RETURN count(r) as gloss_morph_count }
+        CALL { MATCH (:Word)-[r:WORD_MADE_OF]->(:Morpheme) RETURN count(r) as word_morph_count }
+        RETURN gloss_count, word_count, morpheme_count, analyzes_count,
+               gloss_word_count, gloss_morph_count, word_morph_count
+    """)
+    counts = result.single()
+    gloss_count = counts["gloss_count"]
+    word_count = counts["word_count"]
+    morpheme_count = counts["morpheme_count"]
+    analyzes_count = counts["analyzes_count"]
+    gloss_word_count = counts["gloss_word_count"]
+    gloss_morph_count = counts["gloss_morph_count"]
+    word_morph_count = counts["word_morph_count"]
+
+    print(f"✓ Found {gloss_count} Gloss nodes")
+    print(f"✓ Found {word_count} Word nodes")
+    print(f"✓ Found {morpheme_count} Morpheme nodes")
+    print(f"✓ Found {analyzes_count} ANALYZES relationships")
+    print(f"  - {gloss_word_count} Gloss→Word ANALYZES relationships")
+    print(f"  - {gloss_morph_count} Gloss→Morpheme ANALYZES relationships")
+
+    # Test 7: Sample some actual relationships
+    if analyzes_count > 0:
+        print("\nSample ANALYZES relationships:")
         result = db.run("""
-            MATCH (w:Word)-[r:WORD_MADE_OF]->(m:Morpheme) 
-            RETURN count(r) as count
+            MATCH (g:Gloss)-[r:ANALYZES]->(target)
+            RETURN 
+                labels(g)[0] as source_type,
+                g.annotation as gloss_text,
+                labels(target)[0] as target_type,
+                CASE 
+                    WHEN target:Word THEN target.surface_form
+                    WHEN target:Morpheme THEN target.surface_form
+                    ELSE 'N/A'
+                END as target_text
+            LIMIT 5
         """)
-        word_morph_count = result.single()["count"]
-        print(f"\n✓ Found {word_morph_count} Word→Morpheme WORD_MADE_OF relationships")
-        
-        # Test 9: Test the actual graph-data query
-        print("\n--- Testing graph-data query ---")
-        result = db.run("""
-            MATCH (t:Text)
-            WITH t LIMIT 1
+        for record in result:
+            print(f"  - {record['source_type']}('{record['gloss_text']}') → {record['target_type']}('{record['target_text']}')")
+    
+    # Test 8: Word -> Morpheme count came back with the fused statement
+    print(f"\n✓ Found {word_morph_count} Word→Morpheme WORD_MADE_OF relationships")
+
+    # Test 9: Test the actual graph-data query
+    print("\n--- Testing graph-data query ---")
+    # Staged CALL {} subqueries: resolve the text's words and morphemes
+    # once, then UNWIND them into anchored gloss seeks, instead of the
+    # old stacked-OPTIONAL-MATCH pipeline whose intermediate rows grew
+    # as the cross product of every level
+    result = db.run("""
+        MATCH (t:Text)
+        WITH t LIMIT 1
+        CALL {
+            WITH t
             OPTIONAL MATCH (t)-[:SECTION_PART_OF_TEXT]->(s:Section)
-            OPTIONAL MATCH (s)-[:PHRASE_IN_SECTION]->(ph:Phrase)
-            OPTIONAL MATCH (s)-[:SECTION_CONTAINS]->(w:Word)
-            OPTIONAL MATCH (ph)-[rc:PHRASE_COMPOSED_OF]->(pw:Word)
+            OPTIONAL MATCH (s)-[:SECTION_CONTAINS]->(sw:Word)
+            OPTIONAL MATCH (s)-[:PHRASE_IN_SECTION]->(:Phrase)-[:PHRASE_COMPOSED_OF]->(pw:Word)
+            WITH collect(DISTINCT sw) + collect(DISTINCT pw) as ws
+            UNWIND ws as w
+            WITH DISTINCT w
             OPTIONAL MATCH (w)-[:WORD_MADE_OF]->(m:Morpheme)
-            OPTIONAL MATCH (pw)-[:WORD_MADE_OF]->(pm:Morpheme)
-            
-            // Get all words (combined list for gloss matching)
-            WITH t, s, ph, w, pw, m, pm, rc,
-                 collect(DISTINCT w) + collect(DISTINCT pw) as allWords,
-                 collect(DISTINCT m) + collect(DISTINCT pm) as allMorphemes
-            
-            // Get all glosses that analyze words in this text
-            OPTIONAL MATCH (gw:Gloss)-[:ANALYZES]->(analyzedW:Word)
-            WHERE analyzedW IN allWords
-            
-            // Get all glosses that analyze morphemes in this text  
-            OPTIONAL MATCH (gm:Gloss)-[:ANALYZES]->(analyzedM:Morpheme)
-            WHERE analyzedM IN allMorphemes
-            
-            RETURN 
-                size([w IN allWords WHERE w IS NOT NULL]) as word_count,
-                size([m IN allMorphemes WHERE m IS NOT NULL]) as morpheme_count,
-                count(DISTINCT gw) as gloss_word_count,
-                count(DISTINCT gm) as gloss_morpheme_count
-        """)
-        record = result.single()
-        if record:
-            print(f"Words in text: {record['word_count']}")
-            print(f"Morphemes in text: {record['morpheme_count']}")
-            print(f"Glosses analyzing words: {record['gloss_word_count']}")
-            print(f"Glosses analyzing morphemes: {record['gloss_morpheme_count']}")
-        
-        # Summary
-        print("\n=== SUMMARY ===")
-        if analyzes_count == 0:
-            print("❌ PROBLEM: No ANALYZES relationships found!")
-            print("   This means glosses are not being linked to words/morphemes.")
-            print("   Check the _store_gloss_for_word() and _store_gloss_for_morpheme() functions.")
-        elif gloss_word_count == 0 and gloss_morph_count == 0:
-            print("❌ PROBLEM: ANALYZES relationships exist but not to Word/Morpheme!")
-            print(f"   Total ANALYZES: {analyzes_count}, but 0 to Word and 0 to Morpheme")
-        else:
-            print("✓ Relationships appear to be in the database correctly")
-            print("  The issue is likely in the frontend graph rendering or layout")
-        
-    finally:
-        db.close()
+            RETURN collect(DISTINCT w) as allWords,
+                   collect(DISTINCT m) as allMorphemes
+        }
+        CALL {
+            WITH allWords
+            UNWIND allWords as w
+            MATCH (gw:Gloss)-[:ANALYZES]->(w)
+            RETURN count(DISTINCT gw) as gloss_word_count
+        }
+        CALL {
+            WITH allMorphemes
+            UNWIND allMorphemes as m
+            MATCH (gm:Gloss)-[:ANALYZES]->(m)
+            RETURN count(DISTINCT gm) as gloss_morpheme_count
+        }
+        RETURN
+            size(allWords) as word_count,
+            size(allMorphemes) as morpheme_count,
+            gloss_word_count,
+            gloss_morpheme_count
+    """)
+    record = result.single()
+    if record:
+        print(f"Words in text: {record['word_count']}")
+        print(f"Morphemes in text: {record['morpheme_count']}")
+        print(f"Glosses analyzing words: {record['gloss_word_count']}")
+        print(f"Glosses analyzing morphemes: {record['gloss_morpheme_count']}")
+    
+    # Summary
+    print("\n=== SUMMARY ===")
+    if analyzes_count == 0:
+        print("❌ PROBLEM: No ANALYZES relationships found!")
+        print("   This means glosses are not being linked to words/morphemes.")
+        print("   Check the _store_gloss_for_word() and _store_gloss_for_morpheme() functions.")
+    elif gloss_word_count == 0 and gloss_morph_count == 0:
+        print("❌ PROBLEM: ANALYZES relationships exist but not to Word/Morpheme!")
+        print(f"   Total ANALYZES: {analyzes_count}, but 0 to Word and 0 to Morpheme")
+    else:
+        print("✓ Relationships appear to be in the database correctly")
+        print("  The issue is likely in the frontend graph rendering or layout")
+
+    return {
+        "gloss_count": gloss_count,
+        "word_count": word_count,
+        "morpheme_count": morpheme_count,
+        "analyzes_count": analyzes_count,
+        "gloss_word_count": gloss_word_count,
+        "gloss_morph_count": gloss_morph_count,
+        "word_morph_count": word_morph_count,
+    }
+
 
 if __name__ == "__main__":
-    test_gloss_relationships()
+    _driver = GraphDatabase.driver(
+        settings.NEO4J_URI,
+        auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+    )
+    try:
+        with _driver.session(database=settings.NEO4J_DATABASE) as _session:
+            _check_gloss_relationships(_session)
+    finally:
+        _driver.close()
 
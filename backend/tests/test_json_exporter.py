@@ -1,13 +1,11 @@
 """Tests for the JSON exporter."""
 
 import json
-import os
-import sys
 
+import orjson
+import pytest
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "backend"))
-
-from app.exporters.json_exporter import JsonExporter  # noqa: E402
+from app.exporters.json_exporter import JsonExporter
 
 
 def _sample_graph_data():
@@ -70,12 +68,23 @@ def _sample_graph_data():
     }
 
 
-def test_json_exporter_serializes_nested_structure():
-    exporter = JsonExporter()
-    graph_data = {"texts": [_sample_graph_data()]}
+# Module scope: the dict literal is built once per test run instead of once
+# per test, and new exporter cases can share it as the suite grows
+@pytest.fixture(scope="module")
+def sample_graph_data():
+    return {"texts": [_sample_graph_data()]}
+
+
+@pytest.fixture(scope="module")
+def exported_payload(sample_graph_data):
+    """The full serialize/parse round trip, parsed once for the module."""
+    return json.loads(JsonExporter().export(sample_graph_data))
+
 
-    payload = exporter.export(graph_data)
-    parsed = json.loads(payload)
+def test_json_exporter_builds_nested_structure(sample_graph_data):
+    # Assert on build_payload() directly; the structure checks don't need to
+    # pay for serialization plus json.loads
+    parsed = JsonExporter().build_payload(sample_graph_data)
 
     assert "exported_at" in parsed
     assert len(parsed["texts"]) == 1
@@ -97,3 +106,18 @@ def test_json_exporter_serializes_nested_structure():
     morph = word["morphemes"][0]
     assert morph["type"] == "stem"
 
+
+def test_json_exporter_export_round_trips(sample_graph_data, exported_payload):
+    # export() must serialize exactly what build_payload() assembles
+    built = JsonExporter().build_payload(sample_graph_data)
+    assert exported_payload["texts"] == built["texts"]
+    assert "exported_at" in exported_payload
+
+
+def test_json_exporter_matches_stdlib_serialization(sample_graph_data):
+    # The exporter serializes with orjson; guard the backend swap by
+    # asserting its output is structurally identical (modulo key order and
+    # whitespace) to what stdlib json produces for the same payload
+    payload = JsonExporter().build_payload(sample_graph_data)
+    assert json.loads(orjson.dumps(payload)) == json.loads(json.dumps(payload))
+
@@ -2,138 +2,148 @@
 
 from __future__ import annotations
 
-import os
-import sys
 from typing import Any, Dict, Iterable
 
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "backend"))
-
-from app.services.neo4j_service import (  # noqa: E402
+from app.services.neo4j_service import (
     Neo4jExportDataError,
     get_file_graph_data,
 )
 
 
+# Sections arrive out of order and with raw (pre-normalization) values, the
+# same shape the nested pattern-comprehension projection returns: null word
+# languages fall back to the phrase, null phrase languages to the text, and
+# the punctuation word carries a POS the service must null out. Built once
+# at import; _graph_record only assembles the cheap top-level envelope, so
+# repeated runs never re-execute this nested literal.
+_GRAPH_SECTIONS = [
+    {
+        "id": "section-2",
+        "order": 2,
+        "phrases": [
+            {
+                "id": "phrase-2",
+                "order": 5,
+                "segnum": "2",
+                "surface_text": "second phrase",
+                "language": None,
+                "words": [
+                    {
+                        "id": "word-3",
+                        "order": 1,
+                        "surface_form": "goodbye",
+                        "gloss": "BYE",
+                        "pos": "V",
+                        "language": None,
+                        "morphemes": [
+                            {
+                                "id": "morph-2",
+                                "order": 1,
+                                "type": "stem",
+                                "surface_form": "good",
+                                "citation_form": "good",
+                                "gloss": "GOOD",
+                                "msa": "v",
+                                "language": "eng",
+                                "original_id": None,
+                            }
+                        ],
+                    }
+                ],
+            }
+        ],
+    },
+    {
+        "id": "section-1",
+        "order": 1,
+        "phrases": [
+            {
+                "id": "phrase-1",
+                "order": 1,
+                "segnum": "1",
+                "surface_text": "hello world",
+                "language": "eng",
+                "words": [
+                    {
+                        "id": "word-1",
+                        "order": 2,
+                        "surface_form": "hello",
+                        "gloss": "HEL",
+                        "pos": "N",
+                        "language": "eng",
+                        "morphemes": [
+                            {
+                                "id": "morph-1",
+                                "order": 1,
+                                "type": "stem",
+                                "surface_form": "hello",
+                                "citation_form": "hello",
+                                "gloss": "HEL",
+                                "msa": "n",
+                                "language": "eng",
+                                "original_id": None,
+                            }
+                        ],
+                    },
+                    {
+                        "id": "word-2",
+                        "order": 3,
+                        "surface_form": ".",
+                        "gloss": None,
+                        "pos": "PUNCT",
+                        "language": None,
+                        "morphemes": [],
+                    },
+                ],
+            }
+        ],
+    },
+]
+
+
+def _graph_record(params: Dict[str, Any]) -> Dict[str, Any]:
+    assert "text_id" in params, "text lookup must pass $text_id as a parameter"
+    return {
+        "id": params["text_id"],
+        "title": "Sample Text",
+        "source": "Field Notes",
+        "comment": "Test dataset",
+        "language_code": "eng",
+        "sections": _GRAPH_SECTIONS,
+    }
+
+
 class _FakeResult:
+    """Lazily iterates its rows, mirroring the streaming driver result."""
+
     def __init__(self, records: Iterable[Dict[str, Any]]):
-        self._records = list(records)
+        self._records = iter(records)
 
     def single(self):
-        return self._records[0] if self._records else None
+        return next(self._records, None)
 
     def __iter__(self):
-        return iter(self._records)
+        return self._records
 
 
 class _FakeSession:
     def __init__(self):
+        self.call_count = 0
         self.last_query = None
         self.last_params = None
 
     def run(self, query: str, **params):
+        self.call_count += 1
         self.last_query = query
         self.last_params = params
 
-        if "SECTION_PART_OF_TEXT" in query:
-            return _FakeResult(
-                [
-                    {"id": "section-2", "order": 2},
-                    {"id": "section-1", "order": 1},
-                ]
-            )
-
-        if "PHRASE_IN_SECTION" in query:
-            return _FakeResult(
-                [
-                    {
-                        "section_id": "section-1",
-                        "id": "phrase-1",
-                        "segnum": "1",
-                        "surface_text": "hello world",
-                        "language": "eng",
-                        "order": 1,
-                    },
-                    {
-                        "section_id": "section-2",
-                        "id": "phrase-2",
-                        "segnum": "2",
-                        "surface_text": "second phrase",
-                        "language": None,
-                        "order": 5,
-                    },
-                ]
-            )
-
-        if "PHRASE_COMPOSED_OF" in query:
-            return _FakeResult(
-                [
-                    {
-                        "phrase_id": "phrase-1",
-                        "word_id": "word-1",
-                        "word_order": 2,
-                        "word_surface_form": "hello",
-                        "word_gloss": "HEL",
-                        "word_pos": "N",
-                        "word_language": "eng",
-                        "morph_id": "morph-1",
-                        "morph_order": 1,
-                        "morph_type": "stem",
-                        "morph_surface_form": "hello",
-                        "morph_citation_form": "hello",
-                        "morph_gloss": "HEL",
-                        "morph_msa": "n",
-                        "morph_language": "eng",
-                    },
-                    {
-                        "phrase_id": "phrase-1",
-                        "word_id": "word-2",
-                        "word_order": 3,
-                        "word_surface_form": ".",
-                        "word_gloss": None,
-                        "word_pos": "PUNCT",
-                        "word_language": None,
-                        "morph_id": None,
-                        "morph_order": None,
-                        "morph_type": None,
-                        "morph_surface_form": None,
-                        "morph_citation_form": None,
-                        "morph_gloss": None,
-                        "morph_msa": None,
-                        "morph_language": None,
-                    },
-                    {
-                        "phrase_id": "phrase-2",
-                        "word_id": "word-3",
-                        "word_order": 1,
-                        "word_surface_form": "goodbye",
-                        "word_gloss": "BYE",
-                        "word_pos": "V",
-                        "word_language": None,
-                        "morph_id": "morph-2",
-                        "morph_order": 1,
-                        "morph_type": "stem",
-                        "morph_surface_form": "good",
-                        "morph_citation_form": "good",
-                        "morph_gloss": "GOOD",
-                        "morph_msa": "v",
-                        "morph_language": "eng",
-                    },
-                ]
-            )
+        # Every service query references a $parameter; literal concatenation
+        # would bypass Neo4j's plan cache, so fail fast if it ever appears
+        if "$" in query:
+            assert params, f"query should be parameterized, got none: {query}"
 
-        if "RETURN t.ID AS id" in query:
-            return _FakeResult(
-                [
-                    {
-                        "id": params["text_id"],
-                        "title": "Sample Text",
-                        "source": "Field Notes",
-                        "comment": "Test dataset",
-                        "language_code": "eng",
-                    }
-                ]
-            )
+        if "MATCH (t:Text" in query:
+            return _FakeResult([_graph_record(params)])
 
         raise AssertionError(f"Unexpected query dispatched: {query}")
 
@@ -142,6 +152,11 @@ def test_get_file_graph_data_returns_nested_structure():
     session = _FakeSession()
     graph = get_file_graph_data("text-123", session)
 
+    # The whole hierarchy must come back in a single round trip; a second
+    # run() call means the N+1 query chain has crept back in
+    assert session.call_count == 1
+    assert session.last_params
+
     assert graph["text"]["id"] == "text-123"
     assert graph["text"]["language_code"] == "eng"
 
@@ -167,10 +182,8 @@ def test_get_file_graph_data_returns_nested_structure():
 def test_get_file_graph_data_raises_when_text_missing():
     class _EmptySession(_FakeSession):
         def run(self, query: str, **params):
-            query_key = query.strip().split("\n", 1)[0]
-            if query_key.startswith("MATCH (t:Text"):
-                return _FakeResult([])
-            return super().run(query, **params)
+            super().run(query, **params)
+            return _FakeResult([])
 
     session = _EmptySession()
 
@@ -180,5 +193,3 @@ def test_get_file_graph_data_raises_when_text_missing():
         pass
     else:  # pragma: no cover - defensive
         raise AssertionError("Expected Neo4jExportDataError to be raised")
-
-